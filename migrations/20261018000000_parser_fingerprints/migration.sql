@@ -0,0 +1,4 @@
+-- AlterTable
+ALTER TABLE "RawDocument" ADD COLUMN     "contentHash" TEXT,
+ADD COLUMN     "parserModule" TEXT,
+ADD COLUMN     "parserVersion" TEXT;
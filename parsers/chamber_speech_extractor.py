@@ -1,5 +1,18 @@
-import re
+import collections
 from parsers.errors import *
+from parsers.text import collapse_whitespace
+
+
+class _PendingEntry:
+    """An element met while streaming, waiting until it can be extracted."""
+
+    __slots__ = ("elem", "needs", "holds", "unpaired")
+
+    def __init__(self, elem, el, top):
+        self.elem = elem  # as returned by _extract_elements
+        self.needs = [el]  # elements that must be fully parsed first
+        self.holds = [top]  # outermost elements kept in the tree for it
+        self.unpaired = False  # question still looking for its answer
 
 
 class ChamberSpeechExtractor:
@@ -10,37 +23,39 @@ class ChamberSpeechExtractor:
         self.date = date
         self.parliament = parliament
 
-        # Build child → parent map
-        self.parent_map = {
-            child: parent for parent in self.root.iter() for child in parent
-        }
+        # Title path (root → element) of every ancestor seen so far
+        self._title_paths = {}
 
-    def _extract_elements(self):
-        check_elements = self.root.xpath(".//speech | .//question | .//answer")
+        # Streaming state, see start()
+        self._queue = collections.deque()  # questions and speeches, in order
+        self._orphans = []  # answers no question claimed
+        self._unpaired = {}  # parent → questions waiting for an answer
+        self._open = []  # speech/question/answer elements being parsed
+        self._parsed = set()  # ... and those that have been fully parsed
+        self._holds = collections.Counter()  # outermost element → entries
+        self._extracted = 0
 
-        # If no relevant elements found, raise an exception
-        if not check_elements:
-            raise HansardNoElementsException("No parsable Elements")
+    def _extract_elements(self):
+        """
+        Pair each question with the first answer among its later siblings, in
+        one pass over the tree.
 
+        Questions and speeches are returned in document order, followed by
+        the answers that no question claimed (orphans). An answer always
+        comes after its question, so by the time an answer is reached every
+        question that could claim it has been seen.
+        """
         elements = []
-        raw_elements = list(self.root.iter())
-
+        orphan_answers = []
         used_answers = set()  # store id() of used answers
+        next_answers = {}  # parent → {child: first answer after child}
 
-        # First pass: handle question+answer or question-only
-        for el in raw_elements:
-            tag = el.tag.lower()
-            if tag == "question":
+        for el in self.root.iter("question", "answer", "speech"):
+            if el.tag == "question":
                 parent = el.getparent()
-                found_el = False
-                answer = None
-                for child in parent:
-                    if child is el:
-                        found_el = True
-                        continue
-                    if found_el and child.tag.lower() == "answer":
-                        answer = child
-                        break
+                if parent not in next_answers:
+                    next_answers[parent] = self._next_answers(parent)
+                answer = next_answers[parent][el]
 
                 if answer is not None:
                     elements.append(
@@ -52,132 +67,236 @@ class ChamberSpeechExtractor:
                     )
                     used_answers.add(id(answer))  # mark this answer as used
                 else:
-                    # if theere are no
                     elements.append(
                         {
                             "type": "question",
                             "question": self._clean_element(el),
                         }
                     )
-            elif tag == "speech":
+            elif el.tag == "speech":
                 elements.append(
                     {"type": "speech", "element": self._clean_element(el)}
                 )
-
-        # Second pass: add orphan answers
-        for el in raw_elements:
-            if el.tag.lower() == "answer" and id(el) not in used_answers:
-                elements.append(
+            elif id(el) not in used_answers:
+                orphan_answers.append(
                     {"type": "answer", "element": self._clean_element(el)}
                 )
-        return elements
+
+        # If no relevant elements found, raise an exception
+        if not elements and not orphan_answers:
+            raise HansardNoElementsException("No parsable Elements")
+
+        return elements + orphan_answers
+
+    @staticmethod
+    def _next_answers(parent):
+        """Map each child of parent to the first answer sibling after it."""
+        next_answer = {}
+        answer = None
+        for child in reversed(parent):
+            next_answer[child] = answer
+            if child.tag == "answer":
+                answer = child
+        return next_answer
 
     def extract(self):
         elements = self._extract_elements()
-        results = []
-        for elem in elements:
-            if elem["type"] == "question" and "answer" in elem.keys():
-                title = self._get_debate_info(elem["question"])
-                q_author, q_interjections, q_text = self.speech_parsing_class(
-                    elem["question"], parliament = self.parliament
-                ).extract()
-                a_author, a_interjections, a_text = self.speech_parsing_class(
-                    elem["answer"], parliament = self.parliament
-                ).extract()
-                entry = {
-                    "type": "question",
-                    "interjections": q_interjections,
-                    "text": q_text,
-                    "author": q_author,
+        # Titles come from the tree as parsed, before any speech is extracted
+        titles = [
+            self._get_debate_info(
+                elem["question"]
+                if elem["type"] == "question"
+                else elem["element"]
+            )
+            for elem in elements
+        ]
+        return [
+            self._extract_entry(elem, title)
+            for elem, title in zip(elements, titles)
+        ]
+
+    def _extract_entry(self, elem, title):
+        """Extract one element found by _extract_elements into its entry."""
+        if elem["type"] == "question" and "answer" in elem.keys():
+            q_author, q_interjections, q_text = self.speech_parsing_class(
+                elem["question"], parliament = self.parliament
+            ).extract()
+            a_author, a_interjections, a_text = self.speech_parsing_class(
+                elem["answer"], parliament = self.parliament
+            ).extract()
+            return {
+                "type": "question",
+                "interjections": q_interjections,
+                "text": q_text,
+                "author": q_author,
+                "title": title,
+                "answer": {
+                    "type": "answer",
+                    "author": a_author,
+                    "text": a_text,
+                    "interjections": a_interjections,
                     "title": title,
-                    "answer": {
-                        "type": "answer",
-                        "author": a_author,
-                        "text": a_text,
-                        "interjections": a_interjections,
-                        "title": title,
-                    },
-                }
-                results.append(entry)
-            elif elem["type"] == "question" and "answer" in elem.keys():
-                # Question with answer - need to set parliament before calling extract
-                q_extractor = self.speech_parsing_class(elem["question"],parliament = self.parliament)
-                q_author, q_interjections, q_text = q_extractor.extract()
-                
-                a_extractor = self.speech_parsing_class(elem["answer"],parliament = self.parliament)
-                a_author, a_interjections, a_text = a_extractor.extract()
-                
-                entry = {
-                    "type": "question",
-                    "interjections": q_interjections,
-                    "text": q_text,
-                    "author": q_author,
-                    "title": self._get_debate_info(elem["question"]),
-                    "answer": {
-                        "type": "answer",
-                        "author": a_author,
-                        "text": a_text,
-                        "interjections": a_interjections,
-                        "title": self._get_debate_info(elem["question"]),
-                    },
-                }
-                results.append(entry)
-            elif elem["type"] == "question" and "answer" not in elem.keys():
-                q_extractor = self.speech_parsing_class(elem["question"],parliament = self.parliament)
-                q_extractor.parliament = self.parliament
-                q_author, q_interjections, q_text = q_extractor.extract()
-
-                entry = {
-                    "type": "question",
-                    "author": q_author,
-                    "text": q_text,
-                    "interjections": q_interjections,
-                    "title": self._get_debate_info(elem["question"]),
-                }
-                results.append(entry)
-
-            elif elem["type"] in ["answer", "speech"]:
-                speech_extractor = self.speech_parsing_class(elem["element"],
-                                                             parliament =
-                                                             self.parliament)
-                speech_extractor.parliament = self.parliament
-                author, interjections, text = speech_extractor.extract()
-                entry = {
-                    "type": elem["type"],
-                    "author": author,
-                    "title": self._get_debate_info(elem["element"]),
-                    "text": text,
-                    "interjections": interjections,
-                }
-                results.append(entry)
-            else:
-                raise FailedElementParsingException(elem)
+                },
+            }
+        elif elem["type"] == "question" and "answer" not in elem.keys():
+            q_extractor = self.speech_parsing_class(elem["question"],parliament = self.parliament)
+            q_extractor.parliament = self.parliament
+            q_author, q_interjections, q_text = q_extractor.extract()
+
+            return {
+                "type": "question",
+                "author": q_author,
+                "text": q_text,
+                "interjections": q_interjections,
+                "title": title,
+            }
+
+        elif elem["type"] in ["answer", "speech"]:
+            speech_extractor = self.speech_parsing_class(elem["element"],
+                                                         parliament =
+                                                         self.parliament)
+            speech_extractor.parliament = self.parliament
+            author, interjections, text = speech_extractor.extract()
+            return {
+                "type": elem["type"],
+                "author": author,
+                "title": title,
+                "text": text,
+                "interjections": interjections,
+            }
+        else:
+            raise FailedElementParsingException(elem)
+
+    def start(self, el):
+        """
+        Streaming counterpart of extract(): note the start of el.
+
+        HansardStreamExtractor calls start() and end() for every element
+        below self.root as it is parsed, then close(); end() and close()
+        return the entries they completed. Questions and speeches
+        are queued in document order; an answer claims the questions waiting
+        under the same parent, as in _extract_elements. An entry is extracted
+        once its elements are fully parsed and every entry before it is done,
+        so the results come out in the same order as extract(). The outermost
+        speech, question or answer around an extracted entry is then removed
+        from the tree.
+        """
+        if el.tag not in ("question", "answer", "speech"):
+            return
+        top = self._open[0] if self._open else el
+        self._open.append(el)
+        if el.tag == "question":
+            elem = {"type": "question", "question": el}
+            pending = _PendingEntry(elem, el, top)
+            pending.unpaired = True
+            self._unpaired.setdefault(el.getparent(), []).append(pending)
+            self._queue.append(pending)
+        elif el.tag == "speech":
+            pending = _PendingEntry({"type": "speech", "element": el}, el, top)
+            self._queue.append(pending)
+        else:
+            questions = self._unpaired.pop(el.getparent(), None)
+            if questions:
+                for pending in questions:
+                    pending.elem["answer"] = el
+                    pending.needs.append(el)
+                    pending.holds.append(top)
+                    pending.unpaired = False
+                    self._holds[top] += 1
+                return
+            pending = _PendingEntry({"type": "answer", "element": el}, el, top)
+            self._orphans.append(pending)
+        self._holds[top] += 1
+
+    def end(self, el):
+        """
+        Streaming: note the end of el and return the entries it completed.
+        """
+        # No answer can follow the questions still waiting under el
+        for pending in self._unpaired.pop(el, ()):
+            pending.unpaired = False
+        if self._open and self._open[-1] is el:
+            self._open.pop()
+            self._parsed.add(el)
+
+        results = []
+        while self._queue:
+            pending = self._queue[0]
+            if pending.unpaired or not all(
+                el in self._parsed for el in pending.needs
+            ):
+                break
+            self._queue.popleft()
+            results.append(self._emit(pending))
+        return results
 
+    def close(self):
+        """Streaming: finish the chamber and return its remaining entries."""
+        results = self.end(self.root)
+        if self._queue:
+            raise FailedElementParsingException(self._queue[0].elem)
+        results.extend(self._emit(pending) for pending in self._orphans)
+        self._orphans = []
+        if not self._extracted:
+            raise HansardNoElementsException("No parsable Elements")
         return results
 
+    def _emit(self, pending):
+        el = pending.needs[0]
+        entry = self._extract_entry(pending.elem, self._get_debate_info(el))
+        self._extracted += 1
+        for top in pending.holds:
+            self._holds[top] -= 1
+            if not self._holds[top]:
+                self._release(top)
+        return entry
+
+    def _release(self, top):
+        """Drop a fully extracted speech, question or answer from the tree."""
+        del self._holds[top]
+        for el in top.iter("question", "answer", "speech"):
+            self._parsed.discard(el)
+            self._title_paths.pop(el, None)
+        parent = top.getparent()
+        if parent is not None:
+            parent.remove(top)
+        top.clear()
+
     def _get_debate_info(self, el):
-        titles = []
-        while el in self.parent_map:
-            parent = self.parent_map[el]
-            # Look for an info element directly under this parent
-            for tag in ["debateinfo", "subdebateinfo", "title"]:
-                info = parent.find(tag)
-                if info is not None:
-                    if info.tag == "title":
-                        titles.append(
-                            re.sub(
-                                r"\s+", " ", "".join(info.itertext())
-                            ).strip()
-                        )
-                    else:
-                        title = info.findtext("title")
-                        if title is not None:
-                            titles.append(title.strip())
-                    break
-            el = parent
-        # Reverse so it's top-down order (debate → subdebate.1 → subdebate.2)
-        titles.reverse()
-        return ", ".join(titles)
+        """
+        Return the debate titles above el, top-down (debate → subdebate.1 →
+        subdebate.2), joined with ", ".
+        """
+        parent = el.getparent()
+        if parent is None:
+            return ""
+        return ", ".join(self._title_path(parent))
+
+    def _title_path(self, el):
+        """Titles of el and its ancestors up to self.root, memoised."""
+        path = self._title_paths.get(el)
+        if path is None:
+            parent = el.getparent()
+            if el is self.root or parent is None:
+                path = ()
+            else:
+                path = self._title_path(parent)
+            title = self._element_title(el)
+            if title is not None:
+                path = path + (title,)
+            self._title_paths[el] = path
+        return path
+
+    def _element_title(self, el):
+        """The title of the first info element directly under el, if any."""
+        for tag in ["debateinfo", "subdebateinfo", "title"]:
+            info = el.find(tag)
+            if info is not None:
+                if info.tag == "title":
+                    return collapse_whitespace("".join(info.itertext()))
+                title = info.findtext("title")
+                return title.strip() if title is not None else None
+        return None
 
     def _clean_element(self, el):
         return el
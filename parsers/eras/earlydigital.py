@@ -9,8 +9,7 @@ Common characteristics:
 """
 
 from parsers.speech_extractor import SpeechExtractor
-
-import string
+from parsers.text import BRACKET_TITLE_SPACE, STRIP_PUNCTUATION, has_title
 
 
 class SpeechExtractorEarlyDigital(SpeechExtractor):
@@ -29,13 +28,13 @@ class SpeechExtractorEarlyDigital(SpeechExtractor):
         children = elem.getchildren()
         for child in children:
             # Check if the element is an interjcetion element (full size)
-            if self._is_interjection_element(child) == (True, False):
+            if self._classify(child)[:2] == (True, False):
                 # Check for inline para interjections within this interjection block
                 subchildren = child.getchildren()
                 for sub in subchildren:
                     # Only move para elements that are interjections with content
                     if sub.tag.lower() == "para" and all(
-                        self._is_interjection_element(sub)
+                        self._classify(sub)[:2]
                     ):
                         # Check that the para has meaningful text content
                         sub_text = "".join(sub.itertext()).strip()
@@ -81,14 +80,10 @@ class SpeechExtractorEarlyDigital(SpeechExtractor):
                     # interjection
 
                     para_text = "".join(t.strip() for t in et_elem.itertext())
-                    para_text = para_text.translate(
-                        str.maketrans("", "", string.punctuation)
-                    )
+                    para_text = para_text.translate(STRIP_PUNCTUATION)
 
                     emph_text = "".join(t.strip() for t in child.itertext())
-                    emph_text = emph_text.translate(
-                        str.maketrans("", "", string.punctuation)
-                    )
+                    emph_text = emph_text.translate(STRIP_PUNCTUATION)
                     # If all text is inside the emphasis element, the texts should match
                     if (
                         para_text == emph_text
@@ -149,24 +144,11 @@ class SpeechExtractorEarlyDigital(SpeechExtractor):
     def _clean_text(self, text):
 
         # Check if there's a title in brackets or parentheses at the start and remove it
-        import re
-
-        bracket_title_pattern = r"^(?:\[|\()([^\]\)]+)(?:\]|\))\s*"
-        match = re.match(bracket_title_pattern, text)
+        match = BRACKET_TITLE_SPACE.match(text)
         if match:
             bracket_content = match.group(1)
             # Check if the bracketed content looks like a title
-            title_indicators = [
-                "Mr",
-                "Mrs",
-                "Ms",
-                "Dr",
-                "Senator",
-                "Sir",
-                "Madam",
-                "Hon",
-            ]
-            if any(ti in bracket_content for ti in title_indicators):
+            if has_title(bracket_content):
                 text = text[match.end() :]
 
         # If there's a " - " in the text, check if the part before it looks like a title
@@ -175,21 +157,8 @@ class SpeechExtractorEarlyDigital(SpeechExtractor):
             before = parts[0].strip()
             after = parts[1].strip()
 
-            # Check if the part before " - " contains title-like elements
-            title_indicators = [
-                "Mr",
-                "Mrs",
-                "Ms",
-                "Dr",
-                "Senator",
-                "Sir",
-                "Madam",
-                "Hon",
-            ]
-            has_title = any(ti in before for ti in title_indicators)
-
             # If the part before " - " is short and has a title, remove it
-            if has_title and len(before) < 60:
+            if has_title(before) and len(before) < 60:
                 text = after
 
         # Strip leading whitespace/punctuation
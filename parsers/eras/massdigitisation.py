@@ -12,13 +12,13 @@ Common characteristics:
 - Complex element hierarchy with quote and list nesting
 """
 
-import copy
-import re
-
 from parsers.speech_extractor import SpeechExtractor
-
-import re
-import string
+from parsers.text import (
+    BRACKET_TITLE,
+    UPPERCASE_WORD,
+    alphanumeric_length,
+    has_title,
+)
 
 
 class SpeechExtractorMassDigitisation(SpeechExtractor):
@@ -36,13 +36,13 @@ class SpeechExtractorMassDigitisation(SpeechExtractor):
         out = []
         children = elem.getchildren()
         for child in children:
-            if self._is_interjection_element(child) == (True, False):
+            if self._classify(child)[:2] == (True, False):
                 # Check for inline para interjections within this interjection block
                 subchildren = child.getchildren()
                 for sub in subchildren:
                     # Only move para elements that are interjections with content
                     if sub.tag.lower() == "para" and all(
-                        self._is_interjection_element(sub)
+                        self._classify(sub)[:2]
                     ):
                         # Check that the para has meaningful text content
                         sub_text = "".join(sub.itertext()).strip()
@@ -74,29 +74,33 @@ class SpeechExtractorMassDigitisation(SpeechExtractor):
             return "\n".join(texts)
 
     def _pull_inline_paras(self, elem):
-        # Make a copy so modifications don't affect the original element
-        elem = copy.deepcopy(elem)
-
         # Most of the time we grab everything, with the exception of speaker
         # interjections, where we dont grab the speaker name info which sits
         # within the inline element
-        if self._interjection_type_inline(elem) != "general":
-            while True:
-                bold_inline = elem.find('inline[@font-weight="bold"]')
-                if bold_inline is None:
-                    break
-                # Preserve the tail before removing
-                if bold_inline.tail:
-                    if elem.text:
-                        elem.text += bold_inline.tail
-                    else:
-                        elem.text = bold_inline.tail
-                elem.remove(bold_inline)
-                # Stop removing once there's actual para text
-                if elem.text and elem.text.strip():
-                    break
+        if self._cached_interjection_type_inline(elem) == "general":
+            return "".join(elem.itertext())
 
-        return "".join(elem.itertext())
+        # Skip the leading bold inlines without touching the tree: each
+        # skipped inline's tail joins the para text, until there's actual
+        # para text
+        text = elem.text
+        skipped = set()
+        for bold_inline in elem.iterfind('inline[@font-weight="bold"]'):
+            if bold_inline.tail:
+                text = text + bold_inline.tail if text else bold_inline.tail
+            skipped.add(bold_inline)
+            if text and text.strip():
+                break
+
+        parts = [text or ""]
+        for child in elem:
+            if child in skipped:
+                continue
+            if isinstance(child.tag, str):
+                parts.extend(child.itertext())
+            if child.tail:
+                parts.append(child.tail)
+        return "".join(parts)
 
     def _is_interjection_element(self, et_elem):
         """
@@ -131,7 +135,7 @@ class SpeechExtractorMassDigitisation(SpeechExtractor):
                     inline.text
                     and inline.attrib.get("font-weight", "") == "bold"
                     and (
-                        re.search(r"\b[A-Z]+\b", inline.text)
+                        UPPERCASE_WORD.search(inline.text)
                         # Cases when it says 'an opppositon member'
                         # Cannot check for uppercase memeber as in  1920 line 551 - this is a failure case
                         or "member" in inline.text
@@ -212,26 +216,12 @@ class SpeechExtractorMassDigitisation(SpeechExtractor):
         # Strip leading whitespace/punctuation
         text = super()._clean_text(text)
 
-        text = text.lstrip()
-
-        title_indicators = [
-            "Mr",
-            "Mrs",
-            "Ms",
-            "Dr",
-            "Senator",
-            "Sir",
-            "Madam",
-            "Hon",
-        ]
-
         # Check if there's a title in brackets or parentheses at the start and remove it
-        bracket_title_pattern = r"^(?:\[|\()([^\]\)]+)(?:\]|\))"
-        match = re.match(bracket_title_pattern, text)
+        match = BRACKET_TITLE.match(text)
         if match:
             bracket_content = match.group(1)
             # Check if the bracketed content looks like a title
-            if any(ti in bracket_content for ti in title_indicators):
+            if has_title(bracket_content):
                 text = text[match.end() :]
 
         # If there's a " - " in the text, check if the part before it looks like a title
@@ -241,14 +231,11 @@ class SpeechExtractorMassDigitisation(SpeechExtractor):
                 before = parts[0].strip()
                 after = parts[1].strip()
 
-                # Check if the part before " - " contains title-like elements
-                has_title = any(ti in before for ti in title_indicators)
-
                 # If the part before " - " is short and has a title, remove it
                 if (
-                    has_title
-                    and len(re.sub(r"[^a-zA-Z0-9]", "", before)) < 25
-                    and len(re.sub(r"[^a-zA-Z0-9]", "", after)) > 5
+                    has_title(before)
+                    and alphanumeric_length(before) < 25
+                    and alphanumeric_length(after) > 5
                     and "INTERJECTION" not in before
                 ):
                     text = after
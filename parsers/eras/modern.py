@@ -9,9 +9,24 @@ Common characteristics:
 - Complex interjection detection via CSS class names
 """
 
+import lxml.etree as ET
+
 from parsers.speech_extractor import SpeechExtractor
+from parsers.text import INTERJECTION_MARKER
+
+# Every span below an element, in document order
+DESCENDANT_SPANS = ET.XPath("descendant::span")
 
-import re
+INTERJECTING_CLASSES = (
+    "HPS-OfficeInterjecting",
+    "HPS-OfficeContinuation",
+    "HPS-OfficeSpeech",
+    "HPS-MemberIInterjecting",
+    "HPS-GeneralIInterjecting",
+    "HPS-MemberInterjecting",
+    "HPS-GeneralInterjecting",
+)
+OFFICE_ROLES = ("SPEAKER", "DEPUTY", "CLERK", "PRESIDENT", "CHAIR")
 
 
 class SpeechExtractorModern(SpeechExtractor):
@@ -24,6 +39,60 @@ class SpeechExtractorModern(SpeechExtractor):
         super().__init__(element)
         self.name_to_href = {}
         self.parliament = parliament
+        # Element -> {class: [descendant spans]}, see _span_index
+        self._span_indexes = {}
+
+    def _index_spans(self, talk_text):
+        """
+        Index the spans below each paragraph of a talk.text by class, in one
+        pass, so the classification and text lookups are dictionary hits.
+        """
+        for para in talk_text:
+            self._span_index(para)
+
+    def _span_index(self, elem):
+        """
+        Returns {class: [spans]} for the spans below elem, in document
+        order, with "" for spans without a class. Built once per element.
+        """
+        index = self._span_indexes.get(elem)
+        if index is None:
+            index = {}
+            for span in DESCENDANT_SPANS(elem):
+                index.setdefault(span.get("class", ""), []).append(span)
+            self._span_indexes[elem] = index
+        return index
+
+    def _spans_with_class(self, elem, *classes):
+        """
+        The spans below elem with any of the given classes. The list may be
+        the index's own, so callers only read it.
+        """
+        index = self._span_index(elem)
+        if len(classes) == 1:
+            return index.get(classes[0], [])
+        spans = []
+        for class_attr in classes:
+            spans.extend(index.get(class_attr, ()))
+        return spans
+
+    def _spans_with_class_containing(self, elem, fragment):
+        """
+        The spans below elem whose class contains fragment, in document
+        order, as .//span[contains(@class, fragment)] would find them.
+        """
+        index = self._span_index(elem)
+        matching = [key for key in index if fragment in key]
+        if not matching:
+            return []
+        if len(matching) == 1:
+            return index[matching[0]]
+        matching = set(matching)
+        return [
+            span
+            for span in DESCENDANT_SPANS(elem)
+            if span.get("class", "") in matching
+        ]
 
     def _is_interjection_element(self, et_elem):
         """
@@ -31,38 +100,19 @@ class SpeechExtractorModern(SpeechExtractor):
         All interejctions are inline because they are all paras
         """
         # All elements are paras - therefor all interjections are inline
-
-        # Start with the
-        for span in et_elem.findall(".//span"):
-            class_attr = span.get("class", "")
-            if class_attr in [
-                "HPS-OfficeInterjecting",
-                "HPS-OfficeContinuation",
-                "HPS-OfficeSpeech",
-                "HPS-MemberIInterjecting",
-                "HPS-GeneralIInterjecting",
-                "HPS-MemberInterjecting",
-                "HPS-GeneralInterjecting",
-            ]:
+        index = self._span_index(et_elem)
+        for class_attr in INTERJECTING_CLASSES:
+            for span in index.get(class_attr, ()):
                 if span.text and span.text.strip():
                     return True, True
 
-            # Or a contiuation or speech by the speaker
-            elif class_attr in {
-                "HPS-MemberSpeech",
-            }:
-                member_continuation_text = span.text
-                if member_continuation_text and any(
-                    role in member_continuation_text
-                    for role in [
-                        "SPEAKER",
-                        "DEPUTY",
-                        "CLERK",
-                        "PRESIDENT",
-                        "CHAIR",
-                    ]
-                ):
-                    return True, True
+        # Or a contiuation or speech by the speaker
+        for span in index.get("HPS-MemberSpeech", ()):
+            member_continuation_text = span.text
+            if member_continuation_text and any(
+                role in member_continuation_text for role in OFFICE_ROLES
+            ):
+                return True, True
         return False, False
 
     def _pull_paras(self, elem):
@@ -92,14 +142,14 @@ class SpeechExtractorModern(SpeechExtractor):
     def _pull_inline_paras(self, elem):
         """Pull text from span elements with specific HPS classes."""
         # Try for a Memberinterjecting - just desc needed
-        spans = elem.findall(
-            './/span[@class="HPS-MemberIInterjecting"]'
-        ) + elem.findall(".//span[@class='HPS-GeneralIInterjecting']")
+        spans = self._spans_with_class(
+            elem, "HPS-MemberIInterjecting", "HPS-GeneralIInterjecting"
+        )
         for span in spans:
             if span.text:
                 return span.text
         # Try for a generalinterjecting
-        spans = elem.findall('.//span[@class="HPS-GeneralInterjecting"]')
+        spans = self._spans_with_class(elem, "HPS-GeneralInterjecting")
         for span in spans:
             if span.text:
                 return span.text + (span.tail or "")
@@ -115,7 +165,7 @@ class SpeechExtractorModern(SpeechExtractor):
             and interjections[0]["type"] == 3
         ):
             # If so, then the whole thing is actually an interjection
-            secs = re.split(r"\[INTERJECTION\d+\]", text)
+            secs = INTERJECTION_MARKER.split(text)
             # The first element is going to be empty - so now lets allocate
             # the index = 1 element to the initial interjection
             first_section = secs[1]
@@ -141,7 +191,9 @@ class SpeechExtractorModern(SpeechExtractor):
 
     def _get_speech_element_children(self, elem):
         """Get children from talk.text element."""
-        elems = elem.find("talk.text").getchildren()
+        talk_text = elem.find("talk.text")
+        self._index_spans(talk_text)
+        elems = talk_text.getchildren()
         return elems
 
     def _extract_talker(self, elem):
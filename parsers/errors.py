@@ -7,6 +7,12 @@ class HansardNoElementsException(Exception):
         super().__init__(self.message)
 
 
+class HansardStreamingException(Exception):
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
+
+
 class EmptyDocumentError(Exception):
     def __init__(self):
         super().__init__()
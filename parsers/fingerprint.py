@@ -0,0 +1,112 @@
+"""
+Parser version fingerprints.
+
+A parser module's fingerprint is a hash of the parsers/ source files it
+imports, directly or through other parsers modules. It changes whenever an
+edit could change what the parser produces, and not when an unrelated parser
+is edited.
+"""
+
+import ast
+import functools
+import hashlib
+import os
+
+PARSERS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _module_path(module):
+    """Return the source file of a parsers.* module, or None."""
+    parts = module.split(".")
+    if parts[0] != "parsers":
+        return None
+    base = os.path.join(PARSERS_DIR, *parts[1:])
+    path = (
+        os.path.join(base, "__init__.py") if os.path.isdir(base) else base + ".py"
+    )
+    return path if os.path.exists(path) else None
+
+
+def _is_package(module):
+    path = _module_path(module)
+    return path is not None and path.endswith("__init__.py")
+
+
+@functools.lru_cache(maxsize=None)
+def _tree(module):
+    with open(_module_path(module), "r") as f:
+        return ast.parse(f.read())
+
+
+def _reexport(package, name):
+    """Return the module a package's __init__ imports name from."""
+    for node in ast.walk(_tree(package)):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            if any(alias.name == name for alias in node.names):
+                return node.module
+    return package
+
+
+def _dependencies(module):
+    """
+    Yield (module, follow) for every parsers.* import in module.
+
+    `from parsers.eras import X` depends on the module X is defined in rather
+    than on every era the package re-exports, so the package __init__ is
+    hashed but not followed.
+    """
+    for node in ast.walk(_tree(module)):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name, True
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            if not _is_package(node.module):
+                yield node.module, True
+                continue
+            yield node.module, False
+            for alias in node.names:
+                if alias.name == "*":
+                    yield node.module, True
+                elif _module_path(f"{node.module}.{alias.name}"):
+                    yield f"{node.module}.{alias.name}", True
+                else:
+                    yield _reexport(node.module, alias.name), True
+
+
+def parser_sources(module):
+    """Return the sorted source files a parser module depends on."""
+    paths = {_module_path(module)}
+    stack = [module]
+    followed = {module}
+    while stack:
+        for dependency, follow in _dependencies(stack.pop()):
+            path = _module_path(dependency)
+            if path is None:
+                continue
+            paths.add(path)
+            if follow and dependency not in followed:
+                followed.add(dependency)
+                stack.append(dependency)
+    return sorted(paths)
+
+
+@functools.lru_cache(maxsize=None)
+def parser_fingerprint(module):
+    """Return a hex digest of every parsers/ source file module depends on."""
+    digest = hashlib.sha256()
+    for path in parser_sources(module):
+        digest.update(os.path.relpath(path, PARSERS_DIR).encode("utf-8"))
+        digest.update(b"\0")
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def content_hash(text):
+    """
+    Return the hex SHA-256 of a raw document's text.
+
+    Matches encode(sha256(convert_to(text, 'UTF8')), 'hex') in PostgreSQL.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -1,6 +1,7 @@
-from parsers.hansard_extractor import HansardExtractor
+from parsers.hansard_extractor import HansardExtractor, HansardStreamExtractor
 from parsers.chamber_speech_extractor import ChamberSpeechExtractor
 from parsers.eras import SpeechExtractorEarlyDigital
+from parsers.text import STRIP_SPEECH_PUNCTUATION
 
 from parsers.errors import *
 
@@ -23,7 +24,7 @@ class SpeechExtractor1981(SpeechExtractorEarlyDigital):
         if et_elem.tag.lower() == "para":
             para_text = "".join(t.strip() for t in et_elem.itertext())
             # Remove punctuation
-            para_text = para_text.translate(str.maketrans("", "", "—\"':,.!?"))
+            para_text = para_text.translate(STRIP_SPEECH_PUNCTUATION)
             words = para_text.split()
             if len(words) < 5 and any("interject" in w.lower() for w in words):
                 return True, True
@@ -42,3 +43,17 @@ def parse(file_text):
     except EmptyDocumentError:
         results = []
     return results
+
+
+def iter_parse(file_text):
+    """
+    Yield (chamber_info, document) pairs of parse(file_text), one document
+    at a time, with (chamber_info, None) for a chamber without documents.
+    """
+    try:
+        extractor = HansardStreamExtractor(
+            file_text, ChamberSpeechExtractor, SpeechExtractor1981
+        )
+    except EmptyDocumentError:
+        return
+    yield from extractor.iter_documents()
@@ -1,4 +1,4 @@
-from parsers.hansard_extractor import HansardExtractor
+from parsers.hansard_extractor import HansardExtractor, HansardStreamExtractor
 from parsers.chamber_speech_extractor import ChamberSpeechExtractor
 from parsers.eras import SpeechExtractorEarlyDigital
 
@@ -49,3 +49,17 @@ def parse(file_text):
     except EmptyDocumentError:
         results = []
     return results
+
+
+def iter_parse(file_text):
+    """
+    Yield (chamber_info, document) pairs of parse(file_text), one document
+    at a time, with (chamber_info, None) for a chamber without documents.
+    """
+    try:
+        extractor = HansardStreamExtractor(
+            file_text, ChamberSpeechExtractor, SpeechExtractor1992
+        )
+    except EmptyDocumentError:
+        return
+    yield from extractor.iter_documents()
@@ -1,4 +1,4 @@
-from parsers.hansard_extractor import HansardExtractor, print_tag_tree
+from parsers.hansard_extractor import HansardExtractor, HansardStreamExtractor, print_tag_tree
 from parsers.chamber_speech_extractor import ChamberSpeechExtractor
 from parsers.eras import SpeechExtractorModern
 
@@ -16,28 +16,29 @@ class SpeechExtractor2011(SpeechExtractorModern):
         Returns True if the element is an interjection, otherwise False.
         """
         # All elements are paras now
-        for span in et_elem.findall(".//span"):
-            class_attr = span.get("class", "")
-            if class_attr in [
+        index = self._span_index(et_elem)
+        if any(
+            class_attr in index
+            for class_attr in [
                 "HPS-MemberIInterjecting",
                 "HPS-GeneralIInterjecting",
                 "HPS-MemberInterjecting",
                 "HPS-GeneralInterjecting",
-                "HPS-OfficeInterjecting"
-            ]:
-                return True, True
+                "HPS-OfficeInterjecting",
+            ]
+        ):
+            return True, True
 
-            # Or a contiuation or speech by the speaker
-            elif class_attr in {
-                "HPS-MemberContinuation",
-                "HPS-MemberSpeech",
-            }:
-                member_continuation_text = span.text
-                if member_continuation_text and any(
-                    role in member_continuation_text
-                    for role in ["SPEAKER", "DEPUTY", "CLERK", "PRESIDENT", "CHAIR"]
-                ):
-                    return True, True
+        # Or a contiuation or speech by the speaker
+        for span in self._spans_with_class(
+            et_elem, "HPS-MemberContinuation", "HPS-MemberSpeech"
+        ):
+            member_continuation_text = span.text
+            if member_continuation_text and any(
+                role in member_continuation_text
+                for role in ["SPEAKER", "DEPUTY", "CLERK", "PRESIDENT", "CHAIR"]
+            ):
+                return True, True
         return False, False
 
     def _interjection_type_inline(self, et_elem):
@@ -79,3 +80,17 @@ def parse(file_text):
         results = []
     return results
 
+
+def iter_parse(file_text):
+    """
+    Yield (chamber_info, document) pairs of parse(file_text), one document
+    at a time, with (chamber_info, None) for a chamber without documents.
+    """
+    try:
+        extractor = HansardStreamExtractor(
+            file_text, ChamberSpeechExtractor, SpeechExtractor2011
+        )
+    except EmptyDocumentError:
+        return
+    yield from extractor.iter_documents()
+
@@ -1,4 +1,4 @@
-from parsers.hansard_extractor import HansardExtractor, print_tag_tree
+from parsers.hansard_extractor import HansardExtractor, HansardStreamExtractor, print_tag_tree
 from parsers.chamber_speech_extractor import ChamberSpeechExtractor
 from parsers.eras import SpeechExtractorModern
 
@@ -55,8 +55,8 @@ class SpeechExtractor2021(SpeechExtractorModern):
             return "general"
         if t == "HPS-MemberInterjecting":
             member_text = ""
-            name_spans = et_elem.xpath(
-                ".//span[contains(@class, 'HPS-MemberInterjecting')]"
+            name_spans = self._spans_with_class_containing(
+                et_elem, "HPS-MemberInterjecting"
             )
             for span in name_spans:
                 if span.text:
@@ -82,3 +82,17 @@ def parse(file_text):
         results = []
     return results
 
+
+def iter_parse(file_text):
+    """
+    Yield (chamber_info, document) pairs of parse(file_text), one document
+    at a time, with (chamber_info, None) for a chamber without documents.
+    """
+    try:
+        extractor = HansardStreamExtractor(
+            file_text, ChamberSpeechExtractor, SpeechExtractor2021
+        )
+    except EmptyDocumentError:
+        return
+    yield from extractor.iter_documents()
+
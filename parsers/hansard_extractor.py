@@ -4,6 +4,25 @@ from lxml import html
 import lxml.etree as ET
 from parsers.errors import *
 
+_HANSARD_START = re.compile(r"<hansard", re.IGNORECASE)
+
+_CHAR_MAP = {
+    "&mdash;": "---",
+    "&nbsp;": " ",  # optional: handles Word exports
+}
+
+_STRIP_PATTERN = re.compile(
+    r"</?(?:mc|v|o|w10|w|o14|m):[^>]*>"  # unbound namespace tags
+    r'|\s[a-zA-Z0-9]+:[a-zA-Z0-9\-]+="[^"]*"'  # xmlns decls, prefix:attr="..."
+    r"|(?i:<BREAK[^>]*>|<TAB[^>]*>)"  # break elements
+)
+
+# What lxml.html.fromstring treats as a whole HTML document
+_FULL_HTML = re.compile(r"^\s*<(?:html|!doctype)", re.IGNORECASE)
+
+# Characters of raw text cleaned and fed to the streaming parser at a time
+STREAM_CHUNK_SIZE = 2**16
+
 
 class HansardExtractor:
 
@@ -31,8 +50,7 @@ class HansardExtractor:
         if len(hansard_string) == 0:
             raise EmptyDocumentError
 
-        cleaned_string = self._clean_hansard(hansard_string)
-        self.root = ET.fromstring(cleaned_string)
+        self.root = self._repair_hansard(hansard_string)
 
     def extract(self):
         chambers = self._get_distinct_chambers()
@@ -122,48 +140,41 @@ class HansardExtractor:
             "house": house,
         }
 
-    def _clean_hansard(self, string):
+    @staticmethod
+    def _clean_hansard_text(string):
         # Step 1: Strip problematic declarations
-        lines = string.split("\n")
-        if lines:
-            for i, line in enumerate(lines):
-                if "<hansard" in line.lower():
-                    string = "\n".join(lines[i:])
-                    break
+        match = _HANSARD_START.search(string)
+        if match:
+            string = string[string.rfind("\n", 0, match.start()) + 1 :]
 
         # Step 2: Replace character entities
-        char_map = {
-            "&mdash;": "---",
-            "&nbsp;": " ",  # optional: handles Word exports
-        }
-        for k, v in char_map.items():
+        for k, v in _CHAR_MAP.items():
             string = string.replace(k, v)
 
-        # Step 3: Remove unbound namespace-prefixed tags (mc:, v:, o:, w10:, etc.)
-        # This prevents XML parser from failing
-        string = re.sub(r"<(/?)(mc|v|o|w10|w|o14|m):[^>]*>", "", string)
-        string = re.sub(
-            r'\s(xmlns:[a-zA-Z0-9]+)="[^"]+"', "", string
-        )  # remove xmlns decls
-        string = re.sub(
-            r'\s[a-zA-Z0-9]+:[a-zA-Z0-9\-]+="[^"]*"', "", string
-        )  # remove prefix:attr="..."
+        # Step 3: Remove unbound namespace-prefixed tags (mc:, v:, o:, w10:,
+        # etc.), xmlns declarations, prefixed attributes and BREAK/TAB
+        # elements in a single pass
+        return _STRIP_PATTERN.sub("", string)
+
+    @staticmethod
+    def _repair_hansard(string):
+        """
+        Clean the raw Hansard text and return the repaired lxml tree.
 
-        # Remove all break elements
-        string = re.sub(r"<BREAK[^>]*>", "", string, flags=re.IGNORECASE)
-        string = re.sub(r"<TAB[^>]*>", "", string, flags=re.IGNORECASE)
+        The forgiving HTML parser output is used directly, so there is no
+        serialise-then-reparse round trip.
+        """
+        string = HansardExtractor._clean_hansard_text(string)
 
         # Step 4: Parse using forgiving HTML parser
         try:
             repaired = html.fromstring(string)
-            ET.strip_tags(repaired, ET.Comment)
-            fixed_xml = html.tostring(repaired, method="xml").decode()
         except ET.XMLSyntaxError:
             raise FailedTextExtractionException(
                 "XML could not be parsed even after cleaning."
             )
-
-        return fixed_xml
+        ET.strip_tags(repaired, ET.Comment)
+        return repaired
 
     def _find_session_date(self):
         # 1. Try <HANSARD DATE="...">
@@ -197,6 +208,254 @@ class HansardExtractor:
         raise ValueError("No valid session date found in the XML.")
 
 
+class HansardStreamExtractor(HansardExtractor):
+    """
+    Opt-in streaming variant of HansardExtractor.
+
+    iter_extract() yields the same chamber dicts as extract(), one chamber at
+    a time, and iter_documents() yields their documents one at a time. The
+    text is cleaned a chunk at a time and fed to an incremental HTML parser,
+    and each chamber's parser extracts speeches and questions as soon as
+    they are complete and then drops them from the tree, so neither a
+    cleaned copy of the text nor the whole tree is ever held.
+
+    A few layouts can only be handled with the whole tree: debates directly
+    under <hansard>, a chamber that appears twice, a session header after a
+    chamber and text that lxml would not parse to a single <hansard>
+    (or <div>) root. When one of these shows up before anything has been
+    yielded, the document is parsed with HansardExtractor instead; after
+    that, HansardStreamingException is raised and the caller should fall
+    back to extract() on a fresh HansardExtractor.
+    """
+
+    def __init__(
+        self,
+        source,
+        chamber_parsing_class,
+        speech_parsing_class,
+        from_file=False,
+        chunk_size=STREAM_CHUNK_SIZE,
+    ):
+        self.chamber_parsing_class = chamber_parsing_class
+        self.speech_parsing_class = speech_parsing_class
+        self.chunk_size = chunk_size
+        if from_file:
+            with open(source, "rb") as f:
+                raw = f.read()
+            self.hansard_string = raw.decode("utf-8")
+        else:
+            self.hansard_string = source
+
+        if len(self.hansard_string) == 0:
+            raise EmptyDocumentError
+
+        self.root = None
+
+    def extract(self):
+        return list(self.iter_extract())
+
+    def iter_extract(self):
+        return group_documents(self.iter_documents())
+
+    def iter_documents(self):
+        """
+        Yield (chamber_info, document) pairs, each document as soon as it is
+        extracted. chamber_info is a chamber dict of extract() without its
+        "documents", shared by the chamber's documents; an empty chamber
+        yields (chamber_info, None).
+        """
+        yielded = False
+        try:
+            for pair in self._iter_documents():
+                yielded = True
+                yield pair
+        except _StreamFallback as e:
+            if yielded:
+                raise HansardStreamingException(e.message)
+            self.root = self._repair_hansard(self.hansard_string)
+            yield from iter_documents(HansardExtractor.extract(self))
+
+    def _iter_documents(self):
+        parser = ET.HTMLPullParser(
+            events=("start", "end"), remove_comments=True
+        )
+        parser.set_element_class_lookup(html.HtmlElementClassLookup())
+        body = None
+        info = None
+        header_seen = False
+        chamber = None  # (element, chamber_info, chamber parser) being parsed
+        keys = set()
+
+        for event, el in self._iter_events(parser):
+            if chamber is not None:
+                element, chamber_info, chamber_parser = chamber
+                if el is not element:
+                    if event == "start":
+                        chamber_parser.start(el)
+                    else:
+                        for doc in chamber_parser.end(el):
+                            yield chamber_info, doc
+                    continue
+                if event == "end":
+                    try:
+                        docs = chamber_parser.close()
+                    except HansardNoElementsException:
+                        yield chamber_info, None
+                    else:
+                        for doc in docs:
+                            yield chamber_info, doc
+                    element.clear()
+                    chamber = None
+                continue
+
+            if event == "end":
+                continue
+            if self.root is None:
+                # lxml.html.fromstring returns the only element in <body>,
+                # here always <hansard>, or else <body> renamed to <div>
+                if el.tag == "html":
+                    continue
+                if el.tag == "body":
+                    body = el
+                    continue
+                if body is None:
+                    raise _StreamFallback("Text parses to an HTML document")
+                if el.tag == "hansard" and not (body.text or "").strip():
+                    self.root = el
+                    continue
+                self.root = body
+            parent = el.getparent()
+            if parent is not self.root:
+                if parent is body or el.tag == "body":
+                    raise _StreamFallback("Text after the <hansard> element")
+                continue
+
+            if el.tag == "session.header":
+                if info is not None and not header_seen:
+                    raise _StreamFallback("Session header after a chamber")
+                header_seen = True
+                continue
+            if el.tag == "para":
+                continue
+            if el.tag == "debate":
+                raise _StreamFallback("Debate outside a chamber")
+            key = el.tag.replace(".xscript", "")
+            if key in keys:
+                raise _StreamFallback(f"Chamber {key} appears twice")
+            keys.add(key)
+            if info is None:
+                # From the root's attributes if there is no session header
+                # yet; one turning up later is a fallback
+                try:
+                    info = self.get_session_info()
+                except ValueError:
+                    raise _StreamFallback("Chamber before the session header")
+            chamber = (
+                el,
+                dict(info, chamber=key),
+                self.chamber_parsing_class(
+                    el,
+                    info["date"],
+                    speech_parsing_class=self.speech_parsing_class,
+                    parliament=info.get("parliament"),
+                ),
+            )
+
+        if self.root is None:
+            raise _StreamFallback("No elements")
+        single = (
+            len(body) == 1
+            and not (body.text or "").strip()
+            and not (body[-1].tail or "").strip()
+        )
+        if single != (self.root is not body):
+            raise _StreamFallback("Text after the <hansard> element")
+        if info is None:
+            self.get_session_info()  # raises as extract() would
+
+    def _iter_events(self, parser):
+        try:
+            for chunk in self._iter_clean_chunks(
+                self.hansard_string, self.chunk_size
+            ):
+                parser.feed(chunk)
+                yield from parser.read_events()
+            parser.close()
+        except ET.XMLSyntaxError:
+            raise FailedTextExtractionException(
+                "XML could not be parsed even after cleaning."
+            )
+        yield from parser.read_events()
+
+    @staticmethod
+    def _iter_clean_chunks(string, chunk_size):
+        """
+        _clean_hansard_text, a chunk at a time.
+
+        Chunks end at a ">" followed by a newline, which no pattern in
+        _clean_hansard_text can match across, so the result joins up to
+        exactly what _clean_hansard_text returns.
+        """
+        match = _HANSARD_START.search(string)
+        start = string.rfind("\n", 0, match.start()) + 1 if match else 0
+        first = True
+        while start < len(string):
+            end = start + chunk_size
+            if end < len(string):
+                cut = string.rfind(">\n", start, end)
+                if cut == -1:
+                    cut = string.find(">\n", end)
+                end = len(string) if cut == -1 else cut + 1
+            chunk = string[start:end]
+            for k, v in _CHAR_MAP.items():
+                chunk = chunk.replace(k, v)
+            chunk = _STRIP_PATTERN.sub("", chunk)
+            if first and _FULL_HTML.match(chunk):
+                raise _StreamFallback("Text parses to an HTML document")
+            first = False
+            yield chunk
+            start = end
+
+
+def iter_documents(chambers):
+    """Flatten extract()'s chamber dicts into iter_documents() pairs."""
+    for chamber in chambers:
+        chamber_info = {k: v for k, v in chamber.items() if k != "documents"}
+        if not chamber["documents"]:
+            yield chamber_info, None
+        for doc in chamber["documents"]:
+            yield chamber_info, doc
+
+
+def group_documents(pairs):
+    """
+    Regroup (chamber_info, document) pairs into extract()'s chamber dicts,
+    yielding each chamber once its last document has been seen.
+    """
+    chamber = None
+    for chamber_info, doc in pairs:
+        if chamber is None or chamber_info is not current:
+            if chamber is not None:
+                yield chamber
+            current = chamber_info
+            # Same key order as extract(): documents, then chamber
+            chamber = {
+                k: v for k, v in chamber_info.items() if k != "chamber"
+            }
+            chamber["documents"] = []
+            chamber["chamber"] = chamber_info["chamber"]
+        if doc is not None:
+            chamber["documents"].append(doc)
+    if chamber is not None:
+        yield chamber
+
+
+class _StreamFallback(Exception):
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
+
+
 def print_tag_tree(element, max_depth, indent=0):
     if indent >= max_depth:
         return
@@ -1,5 +1,5 @@
 from parsers.errors import *
-import re
+from parsers.text import clean_text
 from typing import Literal, Tuple, List
 
 
@@ -7,6 +7,10 @@ class SpeechExtractor:
     def __init__(self, element, parliament=None):
         self.root = element
         self.parliament = parliament
+        # Element -> (is_interjection, is_inline, type), see _classify
+        self._classifications = {}
+        # Element -> _interjection_type_inline(element)
+        self._inline_types = {}
 
     def extract(self):
         author = self._extract_talker(self.root)
@@ -63,6 +67,36 @@ class SpeechExtractor:
 
         raise FailedInterjectionTypeAssingment(et_elem)
 
+    def _classify(self, et_elem) -> Tuple[bool, bool, str | None]:
+        """
+        Returns (is_interjection, is_inline, type) for the element, computed
+        the first time it is asked for and cached for the rest of the parse.
+        The type is None unless the element is an interjection.
+        """
+        classification = self._classifications.get(et_elem)
+        if classification is None:
+            is_element, is_inline = self._is_interjection_element(et_elem)
+            t = None
+            if is_element:
+                if is_inline:
+                    t = self._cached_interjection_type_inline(et_elem)
+                else:
+                    t = self._interjection_type(et_elem)
+            classification = (is_element, is_inline, t)
+            self._classifications[et_elem] = classification
+        return classification
+
+    def _cached_interjection_type_inline(self, et_elem):
+        """
+        _interjection_type_inline, cached per element. Pulling inline text
+        asks for it as well as classification does.
+        """
+        if et_elem in self._inline_types:
+            return self._inline_types[et_elem]
+        t = self._interjection_type_inline(et_elem)
+        self._inline_types[et_elem] = t
+        return t
+
     def _interjection_flag(
         self, et_elem
     ) -> Tuple[Literal[0, 1, 2, 3, 4], bool]:
@@ -76,14 +110,10 @@ class SpeechExtractor:
              3 - office - the speaker, president, or clerk, made the interjection
             4 - error in interjection type assignement
         """
-        is_element, is_inline = self._is_interjection_element(et_elem)
+        is_element, is_inline, t = self._classify(et_elem)
         if not is_element:
             return 0, False
         else:
-            if is_inline:
-                t = self._interjection_type_inline(et_elem)
-            else:
-                t = self._interjection_type(et_elem)
             if t == "speaker":
                 return 1, is_inline
             elif t == "general":
@@ -144,6 +174,4 @@ class SpeechExtractor:
         return interjections, final_main_text
 
     def _clean_text(self, text) -> str:
-        text = re.sub(r"^[^a-zA-Z0-9[]+", "", text)
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
+        return clean_text(text)
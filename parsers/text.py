@@ -0,0 +1,63 @@
+"""
+Text normalisation shared by the speech extractors.
+
+The cleaners run for every paragraph, interjection and speech, so the
+patterns and translation tables they use are built once here rather than on
+each call.
+"""
+
+import re
+import string
+
+# Leading characters that cannot start speech text
+LEADING_JUNK = re.compile(r"^[^a-zA-Z0-9[]+")
+NON_ALPHANUMERIC = re.compile(r"[^a-zA-Z0-9]")
+UPPERCASE_WORD = re.compile(r"\b[A-Z]+\b")
+INTERJECTION_MARKER = re.compile(r"\[INTERJECTION\d+\]")
+
+# A bracketed or parenthesised title at the start, e.g. "(Mr SMITH)"
+BRACKET_TITLE = re.compile(r"^(?:\[|\()([^\]\)]+)(?:\]|\))")
+BRACKET_TITLE_SPACE = re.compile(r"^(?:\[|\()([^\]\)]+)(?:\]|\))\s*")
+
+TITLE_INDICATORS = (
+    "Mr",
+    "Mrs",
+    "Ms",
+    "Dr",
+    "Senator",
+    "Sir",
+    "Madam",
+    "Hon",
+)
+
+# str.translate tables deleting punctuation
+STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation)
+STRIP_SPEECH_PUNCTUATION = str.maketrans("", "", "—\"':,.!?")
+
+
+def clean_text(text: str) -> str:
+    """
+    Drop leading whitespace and punctuation, and collapse whitespace runs.
+
+    Fused equivalent of stripping LEADING_JUNK, replacing \\s+ with a space
+    and stripping: str.split() and \\s agree on what is whitespace, and
+    collapsing first leaves the leading junk as junk.
+    """
+    text = " ".join(text.split())
+    match = LEADING_JUNK.match(text)
+    return text[match.end() :] if match else text
+
+
+def collapse_whitespace(text: str) -> str:
+    """Replace whitespace runs with a single space and strip."""
+    return " ".join(text.split())
+
+
+def has_title(text: str) -> bool:
+    """Whether text contains one of TITLE_INDICATORS."""
+    return any(title in text for title in TITLE_INDICATORS)
+
+
+def alphanumeric_length(text: str) -> int:
+    """The number of ASCII letters and digits in text."""
+    return len(NON_ALPHANUMERIC.sub("", text))
@@ -0,0 +1,179 @@
+"""
+On-disk cache of fetched documents, shared by the scrapers.
+
+Bodies are stored once per distinct content, zlib compressed and named by
+their SHA-256, under <root>/blobs. A sqlite index maps each URL to its blob
+along with the ETag and Last-Modified the server sent, so a cached URL can be
+revalidated with a conditional request. When the blobs outgrow max_bytes the
+least recently used URLs are dropped.
+"""
+
+import collections
+import functools
+import hashlib
+import os
+import sqlite3
+import time
+import zlib
+
+CACHE_DIR = "/cache/http"
+MAX_BYTES = 10 * 2**30
+
+CacheEntry = collections.namedtuple(
+    "CacheEntry", ["url", "digest", "etag", "last_modified"]
+)
+
+
+class FetchCache:
+    """URL keyed, content addressed cache of response bodies."""
+
+    def __init__(self, root: str = CACHE_DIR, max_bytes: int = MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(root, "index.sqlite"))
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used);
+            CREATE INDEX IF NOT EXISTS entries_digest ON entries(digest);
+            CREATE TABLE IF NOT EXISTS blobs (
+                digest TEXT PRIMARY KEY,
+                size INTEGER NOT NULL
+            );
+        """)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        row = self.db.execute(
+            "SELECT url, digest, etag, last_modified FROM entries"
+            " WHERE url = ?",
+            (url,),
+        ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def conditional_headers(self, url: str) -> dict:
+        """Return the If-None-Match / If-Modified-Since headers for url."""
+        entry = self.lookup(url)
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def read(self, url: str) -> str | None:
+        """Return the cached body of url, or None if it is not cached."""
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+        try:
+            with open(self._blob_path(entry.digest), "rb") as f:
+                text = zlib.decompress(f.read()).decode("utf-8")
+        except (OSError, zlib.error):
+            # Blob lost or damaged: forget the entry so it is fetched again
+            self.db.execute("DELETE FROM entries WHERE url = ?", (url,))
+            self.db.commit()
+            return None
+        self.db.execute(
+            "UPDATE entries SET last_used = ? WHERE url = ?", (time.time(), url)
+        )
+        self.db.commit()
+        return text
+
+    def store(self, url, text, etag=None, last_modified=None) -> None:
+        """Cache text as the body of url, then evict down to max_bytes."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            compressed = zlib.compress(data, 6)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+        self.db.execute(
+            "INSERT OR IGNORE INTO blobs (digest, size) VALUES (?, ?)",
+            (digest, os.path.getsize(path)),
+        )
+        previous = self.lookup(url)
+        self.db.execute(
+            """
+            INSERT OR REPLACE INTO entries
+                (url, digest, etag, last_modified, last_used)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (url, digest, etag, last_modified, time.time()),
+        )
+        if previous is not None and previous.digest != digest:
+            # The URL's content changed: free the old body if nothing shares it
+            self._drop_blob_if_unused(previous.digest)
+        self.db.commit()
+        self.evict()
+
+    def _drop_blob_if_unused(self, digest: str) -> int:
+        """Delete digest's blob if no entry uses it, returning its size."""
+        shared = self.db.execute(
+            "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if shared:
+            return 0
+        size = self.db.execute(
+            "SELECT size FROM blobs WHERE digest = ?", (digest,)
+        ).fetchone()
+        self.db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        try:
+            os.remove(self._blob_path(digest))
+        except FileNotFoundError:
+            pass
+        return size[0] if size else 0
+
+    def size(self) -> int:
+        """Return the total compressed size of the cached blobs."""
+        row = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs")
+        return row.fetchone()[0]
+
+    def evict(self) -> None:
+        """
+        Drop least recently used URLs until the blobs fit in max_bytes.
+
+        Blobs no entry refers to, e.g. those of a forgotten entry, are
+        dropped first.
+        """
+        total = self.size()
+        if total <= self.max_bytes:
+            return
+        for (digest,) in self.db.execute(
+            """
+            SELECT digest FROM blobs
+            WHERE NOT EXISTS (
+                SELECT 1 FROM entries WHERE entries.digest = blobs.digest
+            )
+            """
+        ).fetchall():
+            total -= self._drop_blob_if_unused(digest)
+        if total > self.max_bytes:
+            for url, digest in self.db.execute(
+                "SELECT url, digest FROM entries ORDER BY last_used"
+            ).fetchall():
+                self.db.execute("DELETE FROM entries WHERE url = ?", (url,))
+                total -= self._drop_blob_if_unused(digest)
+                if total <= self.max_bytes:
+                    break
+        self.db.commit()
+
+
+@functools.lru_cache(maxsize=None)
+def default_cache() -> FetchCache:
+    """Return the process wide cache under CACHE_DIR."""
+    return FetchCache()
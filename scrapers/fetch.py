@@ -0,0 +1,214 @@
+"""
+Concurrent, rate limited HTTP fetching for the scrapers.
+
+Fetcher wraps one aiohttp session so every request shares a connection pool.
+Requests are capped by a semaphore and a token bucket, and retried with
+exponential backoff that honours Retry-After. prefetch() keeps a bounded
+number of downloads running ahead of the caller, so fetching overlaps
+parsing and database writes.
+
+Given a scrapers.cache.FetchCache, fetches are stored on disk and cached
+URLs are revalidated with conditional requests, or served straight from the
+cache when the caller knows the document cannot change.
+"""
+
+import asyncio
+import collections
+import email.utils
+import random
+import time
+
+import aiohttp
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko)"
+    " Chrome/115.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Connection": "keep-alive",
+}
+
+# Statuses worth retrying; anything else that is not 200 or 404 is an error
+RETRY_STATUSES = {403, 408, 429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value):
+    """Return the delay in seconds a Retry-After header asks for, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def backoff_delay(attempt, base_delay, max_delay, retry_after=None):
+    """
+    Return how long to wait before retry number attempt (starting at 0).
+
+    A Retry-After from the server wins; otherwise the delay doubles each
+    attempt with full jitter, capped at max_delay.
+    """
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))
+
+
+class TokenBucket:
+    """Allow rate requests per second on average, in bursts of up to burst."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.burst, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class Fetcher:
+    """
+    Shared aiohttp session with a concurrency cap, rate limit and retries.
+
+    Use as an async context manager:
+
+        async with Fetcher(concurrency=4, rate=2) as fetcher:
+            text = await fetcher.fetch(url)
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        rate: float = 2.0,
+        burst: int = 4,
+        retries: int = 5,
+        base_delay: float = 2.0,
+        max_delay: float = 120.0,
+        timeout: float = 60.0,
+        headers: dict = None,
+        cache=None,
+    ):
+        self.concurrency = concurrency
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.headers = HEADERS if headers is None else headers
+        self.bucket = TokenBucket(rate, burst)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.cache = cache
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        self.session = aiohttp.ClientSession(
+            connector=connector, headers=self.headers, timeout=self.timeout
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+
+    async def fetch(self, url: str, revalidate: bool = True) -> str | None:
+        """
+        Return the body of url decoded as UTF-8, or None on a 404.
+
+        With a cache, a cached body is returned without a request unless
+        revalidate is set, in which case it is returned on a 304.
+        Raises an Exception once the retries are used up.
+        """
+        conditional = self.cache is not None
+        if conditional and not revalidate:
+            text = self.cache.read(url)
+            if text is not None:
+                return text
+
+        last_error = None
+        for attempt in range(self.retries):
+            retry_after = None
+            headers = self.cache.conditional_headers(url) if conditional else {}
+            await self.bucket.acquire()
+            try:
+                async with self.semaphore:
+                    async with self.session.get(
+                        url, headers=headers
+                    ) as response:
+                        if response.status == 200:
+                            text = await response.text(encoding="utf-8")
+                            if self.cache is not None:
+                                self.cache.store(
+                                    url,
+                                    text,
+                                    response.headers.get("ETag"),
+                                    response.headers.get("Last-Modified"),
+                                )
+                            return text
+                        if response.status == 304 and conditional:
+                            text = self.cache.read(url)
+                            if text is not None:
+                                return text
+                            # Cached blob is gone, ask for the full body
+                            conditional = False
+                            continue
+                        if response.status == 404:
+                            return None
+                        if response.status not in RETRY_STATUSES:
+                            raise Exception(
+                                f"Error: {url} returned {response.status}"
+                            )
+                        retry_after = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        last_error = f"status {response.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = repr(e)
+            if attempt + 1 < self.retries:
+                await asyncio.sleep(
+                    backoff_delay(
+                        attempt, self.base_delay, self.max_delay, retry_after
+                    )
+                )
+        raise Exception(
+            f"Error: Could not fetch {url} after {self.retries} attempts ({last_error})"
+        )
+
+
+async def prefetch(fetch, items, depth: int = 8):
+    """
+    Yield (item, await fetch(item)) for each item, in order.
+
+    Up to depth fetches run ahead of the consumer. If the consumer stops
+    early, the outstanding fetches are cancelled.
+    """
+    in_flight = collections.deque()
+    items = iter(items)
+    try:
+        for item in items:
+            in_flight.append((item, asyncio.ensure_future(fetch(item))))
+            if len(in_flight) >= depth:
+                item, task = in_flight.popleft()
+                yield item, await task
+        while in_flight:
+            item, task = in_flight.popleft()
+            yield item, await task
+    finally:
+        for _, task in in_flight:
+            task.cancel()
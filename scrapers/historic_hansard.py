@@ -6,6 +6,9 @@ from datetime import datetime
 from tqdm import tqdm
 import shutil
 import os
+import io
+import mmap
+import functools
 
 
 # ---- Helper functions ----
@@ -47,15 +50,42 @@ def download_from_github():
                 f.write(data)
                 bar.update(len(data))
 
-    extracted_folder = os.path.join(
-        tmpdir,
-        "hansard-xml-master",
-    )
-    if not os.path.exists(extracted_folder):
-        print("Extracting Zips")
-        with zipfile.ZipFile(local_zip_path, "r") as zip_ref:
-            zip_ref.extractall(tmpdir)
-    return extracted_folder
+    return local_zip_path
+
+
+class MappedFile(mmap.mmap):
+    """mmap with the seekable() ZipFile expects (mmap gained it in 3.13)."""
+
+    def seekable(self):
+        return True
+
+
+@functools.lru_cache(maxsize=None)
+def open_archive():
+    """
+    Open the hansard-xml zip once, memory mapped.
+
+    Members are read straight out of the mapping, so the archive is never
+    extracted and the OS page cache is shared with any forked workers.
+    """
+    local_zip_path = download_from_github()
+    with open(local_zip_path, "rb") as f:
+        mapped = MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return zipfile.ZipFile(mapped, "r")
+
+
+@functools.lru_cache(maxsize=None)
+def archive_index():
+    """Map (house, year) to the member names in the zip central directory."""
+    index = {}
+    for name in open_archive().namelist():
+        # hansard-xml-master/<house>/<year>/<file>
+        parts = name.split("/")
+        if len(parts) != 4 or not parts[3]:
+            continue
+        _, house, year, file = parts
+        index.setdefault((house, year), []).append(name)
+    return index
 
 
 def file_list_extractor(from_day, to_day, use_fine_dates=True):
@@ -63,12 +93,15 @@ def file_list_extractor(from_day, to_day, use_fine_dates=True):
     from_date = datetime.strptime(from_day, "%Y-%m-%d")
     to_date = datetime.strptime(to_day, "%Y-%m-%d")
 
-    path = download_from_github()
+    index = archive_index()
     file_dict = {}
     for house in ["senate", "hofreps"]:
-        for year in os.listdir(os.path.join(path, house)):
+        for (member_house, year), members in index.items():
+            if member_house != house or not year.isdigit():
+                continue
             if from_date.year <= int(year) <= to_date.year:
-                for file in os.listdir(os.path.join(path, house, year)):
+                for path in members:
+                    file = path.rsplit("/", 1)[1]
                     if use_fine_dates:
                         # is always not a proof document if in historic
                         date = grab_and_format_yyyymmdd(file)
@@ -77,9 +110,7 @@ def file_list_extractor(from_day, to_day, use_fine_dates=True):
                                 file_dict[
                                     f"{house}-{grab_and_format_yyyymmdd(file)}"
                                 ] = {
-                                    "path": os.path.join(
-                                        path, house, year, file
-                                    ),
+                                    "path": path,
                                     "is_proof": False,
                                 }
                         else:
@@ -88,17 +119,18 @@ def file_list_extractor(from_day, to_day, use_fine_dates=True):
                         date = grab_and_format_yyyymmdd(file)
                         if date:
                             file_dict[f"{house}-{date}"] = {
-                                "path": os.path.join(path, house, year, file),
+                                "path": path,
                                 "is_proof": False,
                             }
                         else:
                             file_dict[f"{house}-{file}"] = {
-                                "path": os.path.join(path, house, year, file),
+                                "path": path,
                                 "is_proof": False,
                             }
     return file_dict
 
 
 def scraper(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    """Read one member of the archive, decoded as open() would."""
+    with open_archive().open(path) as member:
+        return io.TextIOWrapper(member, encoding="utf-8").read()
@@ -7,6 +7,7 @@ import requests
 import argparse
 from tqdm.asyncio import tqdm_asyncio
 import time
+from scrapers.cache import default_cache
 
 # ---- Helper functions ----
 
@@ -44,6 +45,12 @@ def file_list_extractor(senate=False):
 
 def scraper(file):
     """Download a single file, skipping if it already exists, with retries."""
+    # The OpenAustralia archive never changes, so a cached copy is final
+    cache = default_cache()
+    cached = cache.read(file)
+    if cached is not None:
+        return cached
+
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0 Safari/537.36"
     }
@@ -54,6 +61,12 @@ def scraper(file):
                 resp.raise_for_status()
                 resp.encoding = "utf-8"
                 content = resp.text
+                cache.store(
+                    file,
+                    content,
+                    resp.headers.get("ETag"),
+                    resp.headers.get("Last-Modified"),
+                )
                 return content
         except Exception as e:
             if attempt < 4:
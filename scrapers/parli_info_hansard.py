@@ -6,32 +6,32 @@ from typing import Dict, Any
 from rich.progress import Progress
 import time
 import requests
-import random
+from scrapers.fetch import HEADERS, backoff_delay, parse_retry_after
+from scrapers.cache import default_cache
 
+# One session so the sitting week pages reuse their connection
+session = requests.Session()
+session.headers.update(HEADERS)
 
-def request_with_rate_limit_exception(url, retries=5, delay=20):
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko)"
-        " Chrome/115.0.0.0 Safari/537.36",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Connection": "keep-alive",
-    }
 
-    for _ in range(retries):
+def request_with_rate_limit_exception(url, retries=5, delay=20, headers=None):
+    for attempt in range(retries):
+        retry_after = None
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200:
+            response = session.get(url, headers=headers, timeout=10)
+            if response.status_code in (200, 304):
                 return response
-            elif response.status_code == 403:
-                time.sleep(delay + random.uniform(0, delay))
             elif response.status_code == 404:
                 return None
-            else:
-                time.sleep(delay)
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
         except requests.RequestException:
-            time.sleep(delay)
+            pass
+        if attempt + 1 < retries:
+            # Nothing else paces these requests, and a 403 is ParlInfo rate
+            # limiting: always wait at least delay, as before the backoff
+            time.sleep(
+                delay + backoff_delay(attempt, delay, delay * 7, retry_after)
+            )
     return None
 
 
@@ -167,9 +167,48 @@ def file_list_extractor(
     return xml_links
 
 
-def scraper(path: str) -> str | None:
-    response = request_with_rate_limit_exception(path)
+def scraper(path: str, revalidate: bool = True) -> str | None:
+    """
+    Fetch one Hansard XML through the on-disk cache.
+
+    Cached files are revalidated with a conditional request, or returned
+    without one if revalidate is False.
+    """
+    cache = default_cache()
+    if not revalidate:
+        text = cache.read(path)
+        if text is not None:
+            return text
+
+    response = request_with_rate_limit_exception(
+        path, headers=cache.conditional_headers(path)
+    )
+    if response is not None and response.status_code == 304:
+        text = cache.read(path)
+        if text is not None:
+            return text
+        response = request_with_rate_limit_exception(path)
     if not response:
         return None
     response.encoding = "utf-8"
+    cache.store(
+        path,
+        response.text,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+    )
     return response.text
+
+
+async def async_scraper(
+    path: str, fetcher, revalidate: bool = True
+) -> str | None:
+    """
+    Like scraper(), but through a shared scrapers.fetch.Fetcher so several
+    sitting days can download at once.
+    """
+    try:
+        return await fetcher.fetch(path, revalidate)
+    except Exception:
+        # As scraper(): a file that cannot be fetched is picked up next run
+        return None
@@ -0,0 +1,304 @@
+"""
+Set-based loading of the Parliamentary Handbook metadata.
+
+load_metadata() writes what load_politician_metadata() writes, but stages
+the incoming data in temporary tables and applies it with a handful of
+statements inside one transaction. Parliaments and parliamentarians are only
+updated where a column changed, and a parliamentarian's services are only
+replaced when the set of services differs from what is stored.
+"""
+
+import datetime
+
+import asyncpg
+
+PARLIAMENTARIAN_COLUMNS = [
+    "id",
+    "altId",
+    "firstName",
+    "lastName",
+    "altName",
+    "middleNames",
+    "firstNations",
+    "image",
+    "gender",
+    "dob",
+]
+SERVICE_COLUMNS = [
+    "parliamentarianId",
+    "startDate",
+    "endDate",
+    "isSenate",
+    "seat",
+    "state",
+    "partyName",
+    "parliamentId",
+]
+MINISTER_COLUMNS = [
+    "firstDate",
+    "lastDate",
+    "role",
+    "portfolio",
+    "displayString",
+    "parliamentarianId",
+    "ministryId",
+]
+
+
+def _quoted(columns):
+    return ", ".join(f'"{c}"' for c in columns)
+
+
+async def _load_parliaments(conn, parliaments, now) -> tuple:
+    rows = await conn.fetch(
+        """
+        INSERT INTO "Parliament" (id, "firstDate", "lastDate", "dateModified")
+        SELECT id, first_date, last_date, $4
+        FROM unnest($1::int[], $2::timestamp[], $3::timestamp[])
+            AS t(id, first_date, last_date)
+        ON CONFLICT (id) DO UPDATE
+            SET "firstDate" = EXCLUDED."firstDate",
+                "lastDate" = EXCLUDED."lastDate",
+                "dateModified" = EXCLUDED."dateModified"
+            WHERE ("Parliament"."firstDate", "Parliament"."lastDate")
+                IS DISTINCT FROM (EXCLUDED."firstDate", EXCLUDED."lastDate")
+        RETURNING (xmax = 0) AS inserted
+        """,
+        [int(x["id"]) for x in parliaments],
+        [x["firstDate"] for x in parliaments],
+        [x["lastDate"] for x in parliaments],
+        now,
+    )
+    inserted = sum(row["inserted"] for row in rows)
+    return inserted, len(rows) - inserted
+
+
+async def _load_parliamentarians(conn, politicians, now) -> tuple:
+    await conn.execute("""
+        CREATE TEMP TABLE incoming_parliamentarian (
+            id TEXT PRIMARY KEY,
+            "altId" TEXT[],
+            "firstName" TEXT,
+            "lastName" TEXT,
+            "altName" TEXT,
+            "middleNames" TEXT,
+            "firstNations" BOOLEAN,
+            image TEXT,
+            gender INTEGER,
+            dob TIMESTAMP(3)
+        ) ON COMMIT DROP
+    """)
+    await conn.copy_records_to_table(
+        "incoming_parliamentarian",
+        records=[
+            tuple(x[column] for column in PARLIAMENTARIAN_COLUMNS)
+            for x in politicians
+        ],
+        columns=PARLIAMENTARIAN_COLUMNS,
+    )
+    columns = _quoted(PARLIAMENTARIAN_COLUMNS)
+    updated = _quoted(PARLIAMENTARIAN_COLUMNS[1:])
+    excluded = ", ".join(
+        f'EXCLUDED."{c}"' for c in PARLIAMENTARIAN_COLUMNS[1:]
+    )
+    current = ", ".join(
+        f'"Parliamentarian"."{c}"' for c in PARLIAMENTARIAN_COLUMNS[1:]
+    )
+    rows = await conn.fetch(
+        f"""
+        INSERT INTO "Parliamentarian" ({columns}, "dateModified")
+        SELECT {columns}, $1 FROM incoming_parliamentarian
+        ON CONFLICT (id) DO UPDATE
+            SET ({updated}, "dateModified")
+                = ({excluded}, EXCLUDED."dateModified")
+            WHERE ({current}) IS DISTINCT FROM ({excluded})
+        RETURNING (xmax = 0) AS inserted
+        """,
+        now,
+    )
+    inserted = sum(row["inserted"] for row in rows)
+    return inserted, len(rows) - inserted
+
+
+async def _load_services(conn, politicians, now) -> int:
+    """Replace the services of every parliamentarian whose services changed."""
+    await conn.execute("""
+        CREATE TEMP TABLE incoming_service (
+            "parliamentarianId" TEXT,
+            "startDate" TIMESTAMP(3),
+            "endDate" TIMESTAMP(3),
+            "isSenate" BOOLEAN,
+            seat TEXT,
+            state TEXT,
+            "partyName" TEXT,
+            "parliamentId" INTEGER
+        ) ON COMMIT DROP
+    """)
+    await conn.copy_records_to_table(
+        "incoming_service",
+        records=[
+            (
+                x["id"],
+                service["startDate"],
+                service["endDate"],
+                service["isSenate"],
+                service["seat"],
+                service["state"],
+                service["party"]["connect"]["name"],
+                int(service["parliament"]["connect"]["id"]),
+            )
+            for x in politicians
+            for service in x["services"]["create"]
+        ],
+        columns=SERVICE_COLUMNS,
+    )
+
+    missing = await conn.fetch("""
+        SELECT DISTINCT s."partyName"
+        FROM incoming_service s
+        LEFT JOIN "Party" p ON p.name = s."partyName"
+        WHERE p.id IS NULL
+    """)
+    if missing:
+        names = [row["partyName"] for row in missing]
+        raise ValueError(f"Services reference unknown parties: {names}")
+
+    await conn.execute("""
+        CREATE TEMP TABLE incoming_service_row ON COMMIT DROP AS
+        SELECT s."parliamentarianId", s."startDate", s."endDate",
+               s."isSenate", s.seat, s.state, p.id AS "partyId",
+               s."parliamentId"
+        FROM incoming_service s
+        JOIN "Party" p ON p.name = s."partyName"
+    """)
+    await conn.execute("""
+        CREATE TEMP TABLE changed_service_owner ON COMMIT DROP AS
+        WITH existing AS (
+            SELECT "parliamentarianId", "startDate", "endDate", "isSenate",
+                   seat, state, "partyId", "parliamentId"
+            FROM "Service"
+            WHERE "parliamentarianId" IN (
+                SELECT id FROM incoming_parliamentarian
+            )
+        )
+        SELECT DISTINCT "parliamentarianId" FROM (
+            (SELECT * FROM incoming_service_row EXCEPT ALL
+             SELECT * FROM existing)
+            UNION ALL
+            (SELECT * FROM existing EXCEPT ALL
+             SELECT * FROM incoming_service_row)
+        ) AS difference
+    """)
+    await conn.execute("""
+        DELETE FROM "Service"
+        WHERE "parliamentarianId" IN (
+            SELECT "parliamentarianId" FROM changed_service_owner
+        )
+    """)
+    await conn.execute(
+        """
+        INSERT INTO "Service"
+            ("parliamentarianId", "startDate", "endDate", "isSenate", seat,
+             state, "partyId", "parliamentId", "dateModified")
+        SELECT s.*, $1
+        FROM incoming_service_row s
+        JOIN changed_service_owner c USING ("parliamentarianId")
+        """,
+        now,
+    )
+    return await conn.fetchval("SELECT count(*) FROM changed_service_owner")
+
+
+async def _load_ministries(conn, ministries) -> int:
+    await conn.execute('TRUNCATE "Ministry" CASCADE')
+    await conn.execute('TRUNCATE "Minister" CASCADE')
+    ids = [
+        row["id"]
+        for row in await conn.fetch(
+            """
+            SELECT nextval(pg_get_serial_sequence('"Ministry"', 'id')) AS id
+            FROM generate_series(1, $1)
+            ORDER BY 1
+            """,
+            len(ministries),
+        )
+    ]
+    await conn.copy_records_to_table(
+        "Ministry",
+        records=[
+            (
+                ministry_id,
+                x["leader"],
+                x["name"],
+                x["firstDate"],
+                x["lastDate"],
+                x["isShadow"],
+            )
+            for ministry_id, x in zip(ids, ministries)
+        ],
+        columns=[
+            "id",
+            "parliamentarianId",
+            "name",
+            "firstDate",
+            "lastDate",
+            "isShadow",
+        ],
+    )
+    await conn.copy_records_to_table(
+        "Minister",
+        records=[
+            (
+                y["firstDate"],
+                y["lastDate"],
+                y["role"],
+                y["portfolio"],
+                y["displayString"],
+                y["parliamentarian"],
+                ministry_id,
+            )
+            for ministry_id, x in zip(ids, ministries)
+            for y in x["ministers"]
+        ],
+        columns=MINISTER_COLUMNS,
+    )
+    return len(ministries)
+
+
+async def load_metadata(
+    conn: asyncpg.Connection, ministries, parties, parliaments, politicians
+) -> dict:
+    """
+    Load the output of scripts.politicians.main() in one transaction.
+
+    Returns counts of what changed.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    # Later records win, as they would with one upsert per record
+    parliaments = list({int(x["id"]): x for x in parliaments}.values())
+    politicians = list({x["id"]: x for x in politicians}.values())
+    async with conn.transaction():
+        await conn.execute(
+            """
+            INSERT INTO "Party" (name)
+            SELECT unnest($1::text[])
+            ON CONFLICT (name) DO NOTHING
+            """,
+            list(parties),
+        )
+        parliaments_added, parliaments_updated = await _load_parliaments(
+            conn, parliaments, now
+        )
+        politicians_added, politicians_updated = await _load_parliamentarians(
+            conn, politicians, now
+        )
+        services_replaced = await _load_services(conn, politicians, now)
+        ministries_loaded = await _load_ministries(conn, ministries)
+    return {
+        "parliaments_added": parliaments_added,
+        "parliaments_updated": parliaments_updated,
+        "politicians_added": politicians_added,
+        "politicians_updated": politicians_updated,
+        "services_replaced": services_replaced,
+        "ministries_loaded": ministries_loaded,
+    }
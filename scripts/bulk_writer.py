@@ -0,0 +1,325 @@
+import collections
+import datetime
+import os
+import urllib.parse
+
+import asyncpg
+
+from scripts.fixes import apply_raw_author_fixes, build_sitting_day_data
+
+DOCUMENT_COLUMNS = [
+    "id",
+    "text",
+    "title",
+    "type",
+    "sittingDayId",
+    "rawDocumentId",
+    "rawAuthorId",
+    "dateAdded",
+    "dateModified",
+]
+INTERJECTION_COLUMNS = ["text", "sequence", "type", "rawAuthorId", "documentId"]
+
+# The row handed to apply_raw_author_fixes in place of a Prisma SittingDay
+SittingDayRow = collections.namedtuple("SittingDayRow", ["id", "date", "house"])
+
+
+async def connect() -> asyncpg.Connection:
+    """
+    Open an asyncpg connection to the Prisma DATABASE_URL.
+
+    Prisma keeps the schema in a `schema` query parameter, which libpq does
+    not understand, so it is moved into the connection's search_path.
+    """
+    url = urllib.parse.urlsplit(os.environ["DATABASE_URL"])
+    query = urllib.parse.parse_qs(url.query)
+    schema = query.pop("schema", ["public"])[0]
+    dsn = urllib.parse.urlunsplit(
+        url._replace(query=urllib.parse.urlencode(query, doseq=True))
+    )
+    return await asyncpg.connect(dsn, server_settings={"search_path": schema})
+
+
+class BulkDocumentWriter:
+    """
+    Write parsed documents with COPY instead of one Prisma create per speech.
+
+    Parsed RawDocuments are buffered with add() and written batch_size at a
+    time, each batch in its own transaction. The rows written are the same as
+    insert_document() produces: a Document per speech, a Document per answer
+    linked to its question through _RelatedDocuments, and the interjections
+    of both, with raw authors resolved through apply_raw_author_fixes.
+
+    With replace, the Documents, Interjections and SittingDays already
+    written for each RawDocument are deleted in the same transaction, so a
+    RawDocument is swapped to its new parse atomically. Raw authors are kept.
+    """
+
+    def __init__(
+        self,
+        conn: asyncpg.Connection,
+        batch_size: int = 50,
+        replace: bool = False,
+    ):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.replace = replace
+        self.author_ids = {}
+        # Raw authors this writer created, for an incremental politician join
+        self.new_author_ids = []
+        self.pending = []
+
+    async def load_authors(self) -> None:
+        """Load the existing rawAuthor name -> id map."""
+        rows = await self.conn.fetch('SELECT id, name FROM "rawAuthor"')
+        self.author_ids = {row["name"]: row["id"] for row in rows}
+
+    async def add(
+        self, raw_document_id, parsed_document, date_override=None, stamp=None
+    ):
+        """
+        Buffer a parsed RawDocument.
+
+        stamp holds the parserModule, parserVersion and contentHash to record
+        on the RawDocument when its documents are written.
+        """
+        self.pending.append(
+            (raw_document_id, parsed_document, date_override, stamp)
+        )
+        if len(self.pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write every buffered RawDocument in a single transaction."""
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        async with self.conn.transaction():
+            new_authors = await self._write(pending)
+        # Only remember authors once the transaction that created them commits
+        self.author_ids.update(new_authors)
+        self.new_author_ids.extend(new_authors.values())
+
+    async def _write(self, pending) -> dict:
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+        if self.replace:
+            await self._delete_documents([raw_id for raw_id, *_ in pending])
+
+        # Flatten in insert_document order: question, then its answer
+        rows = []
+        new_names = {}
+        for raw_document_id, parsed_document, date_override, _ in pending:
+            for extract in parsed_document:
+                sitting_day = await self._create_sitting_day(
+                    extract, date_override
+                )
+                for document in extract["documents"]:
+                    documents = [document]
+                    if document["type"] == "question" and "answer" in document:
+                        documents.append(document["answer"])
+                    for i, doc in enumerate(documents):
+                        author = apply_raw_author_fixes(
+                            doc["author"], sitting_day
+                        )
+                        interjections = [
+                            (
+                                inter,
+                                apply_raw_author_fixes(
+                                    inter["author"], sitting_day
+                                ),
+                            )
+                            for inter in doc.get("interjections") or []
+                        ]
+                        for name in [author] + [n for _, n in interjections]:
+                            if name not in self.author_ids:
+                                new_names.setdefault(name, None)
+                        rows.append(
+                            (
+                                doc,
+                                i > 0,
+                                author,
+                                interjections,
+                                sitting_day.id,
+                                raw_document_id,
+                            )
+                        )
+
+        new_authors = await self._create_authors(list(new_names), now)
+        author_ids = {**self.author_ids, **new_authors}
+
+        ids = [
+            row["id"]
+            for row in await self.conn.fetch(
+                """
+                SELECT nextval(pg_get_serial_sequence('"Document"', 'id')) AS id
+                FROM generate_series(1, $1)
+                """,
+                len(rows),
+            )
+        ]
+        ids.sort()
+
+        document_records = []
+        interjection_records = []
+        related_records = []
+        for document_id, row in zip(ids, rows):
+            doc, is_answer, author, interjections, sitting_day_id, raw_id = row
+            document_records.append(
+                (
+                    document_id,
+                    doc["text"],
+                    doc["title"],
+                    doc["type"],
+                    sitting_day_id,
+                    raw_id,
+                    author_ids[author],
+                    now,
+                    now,
+                )
+            )
+            interjection_records.extend(
+                (
+                    inter.get("text"),
+                    inter["sequence"],
+                    inter["type"],
+                    author_ids[name],
+                    document_id,
+                )
+                for inter, name in interjections
+            )
+            if is_answer:
+                # A is the question (citedBy side), B the answer
+                related_records.append((question_id, document_id))
+            else:
+                question_id = document_id
+
+        await self.conn.copy_records_to_table(
+            "Document", records=document_records, columns=DOCUMENT_COLUMNS
+        )
+        await self.conn.copy_records_to_table(
+            "Interjection",
+            records=interjection_records,
+            columns=INTERJECTION_COLUMNS,
+        )
+        await self.conn.copy_records_to_table(
+            "_RelatedDocuments", records=related_records, columns=["A", "B"]
+        )
+
+        stamps = [
+            (
+                raw_id,
+                stamp["parserModule"],
+                stamp["parserVersion"],
+                stamp["contentHash"],
+                now,
+            )
+            for raw_id, _, _, stamp in pending
+            if stamp is not None
+        ]
+        if stamps:
+            await self.conn.executemany(
+                """
+                UPDATE "RawDocument"
+                SET "parserModule" = $2, "parserVersion" = $3,
+                    "contentHash" = $4, "dateModified" = $5
+                WHERE id = $1
+                """,
+                stamps,
+            )
+        return new_authors
+
+    async def _delete_documents(self, raw_document_ids) -> None:
+        """Delete what earlier parses of these RawDocuments wrote."""
+        # Interjection.documentId is ON DELETE SET NULL, so remove them first
+        await self.conn.execute(
+            """
+            DELETE FROM "Interjection" i
+            USING "Document" d
+            WHERE i."documentId" = d.id AND d."rawDocumentId" = ANY($1::int[])
+            """,
+            raw_document_ids,
+        )
+        sitting_day_ids = await self.conn.fetch(
+            """
+            DELETE FROM "Document"
+            WHERE "rawDocumentId" = ANY($1::int[])
+            RETURNING "sittingDayId"
+            """,
+            raw_document_ids,
+        )
+        await self.conn.execute(
+            """
+            DELETE FROM "SittingDay" s
+            WHERE s.id = ANY($1::int[])
+              AND NOT EXISTS (
+                  SELECT 1 FROM "Document" d WHERE d."sittingDayId" = s.id
+              )
+            """,
+            list({row["sittingDayId"] for row in sitting_day_ids}),
+        )
+
+    async def _create_sitting_day(self, info, date_override) -> SittingDayRow:
+        data = build_sitting_day_data(info, date_override)
+        if self.replace:
+            # An earlier parse may have left this chamber with no documents,
+            # which _delete_documents cannot reach from the RawDocument
+            await self.conn.execute(
+                """
+                DELETE FROM "SittingDay" s
+                WHERE s.date = $1 AND s.house = $2 AND s.chamber = $3
+                  AND NOT EXISTS (
+                      SELECT 1 FROM "Document" d WHERE d."sittingDayId" = s.id
+                  )
+                """,
+                data["date"],
+                data["house"],
+                data["chamber"],
+            )
+        try:
+            sitting_day_id = await self.conn.fetchval(
+                """
+                INSERT INTO "SittingDay"
+                    (date, house, chamber, parliament, session, period)
+                VALUES ($1, $2, $3, $4, $5, $6)
+                RETURNING id
+                """,
+                data["date"],
+                data["house"],
+                data["chamber"],
+                data["parliament"],
+                data["session"],
+                data["period"],
+            )
+        except Exception as e:
+            raise ValueError(
+                f"Cannot create sitting day for: {info['date']}, house: {info['house']}, chamber: {info['chamber']}"
+            ) from e
+        return SittingDayRow(sitting_day_id, data["date"], data["house"])
+
+    async def _create_authors(self, names, now) -> dict:
+        """Insert raw authors in first-appearance order, returning their ids."""
+        if not names:
+            return {}
+        rows = await self.conn.fetch(
+            """
+            INSERT INTO "rawAuthor" (name, "dateAdded", "dateModified")
+            SELECT name, $2, $2
+            FROM unnest($1::text[]) WITH ORDINALITY AS t(name, ord)
+            ORDER BY ord
+            ON CONFLICT (name) DO NOTHING
+            RETURNING id, name
+            """,
+            names,
+            now,
+        )
+        created = {row["name"]: row["id"] for row in rows}
+        missing = [name for name in names if name not in created]
+        if missing:
+            # Created by another writer since load_authors()
+            rows = await self.conn.fetch(
+                'SELECT id, name FROM "rawAuthor" WHERE name = ANY($1::text[])',
+                missing,
+            )
+            created.update({row["name"]: row["id"] for row in rows})
+        return created
@@ -0,0 +1,99 @@
+import datetime
+import json
+
+fixes = json.load(open("fixes.json", "r"))
+
+
+class FixesEngine:
+    """
+    The raw author parts of fixes.json, compiled for repeated lookups.
+
+    Speaker alternative names become a set, and the raw_author_fixes rules
+    for each author (its own key first, then its "_"-prefixed key) become a
+    tuple of (house, after, before, id) intervals over sitting dates. Results
+    for authors with rules are memoised per (author, date, house); every other
+    author resolves with two hash lookups. The engine holds only plain data,
+    so it pickles into worker processes.
+    """
+
+    def __init__(self, fixes):
+        self.speaker_alt_names = frozenset(fixes["speaker_alt_names"])
+        raw_author_fixes = fixes["raw_author_fixes"]
+        names = set(raw_author_fixes) | {
+            key[1:] for key in raw_author_fixes if key.startswith("_")
+        }
+        self.rules = {}
+        for name in names:
+            rules = []
+            for key in [name, f"_{name}"]:
+                fix = raw_author_fixes.get(key)
+                if not fix:
+                    continue
+                house = fix.get("house")
+                rules.append(
+                    (
+                        house.lower() if house is not None else None,
+                        _to_date(fix.get("after")),
+                        _to_date(fix.get("before")),
+                        fix["id"],
+                    )
+                )
+            if rules:
+                self.rules[name] = tuple(rules)
+        self.memo = {}
+
+    def resolve(self, author, date, house):
+        """Return the raw author name to store for author on a sitting day."""
+        if author in self.speaker_alt_names:
+            return "10000"
+        rules = self.rules.get(author)
+        if rules is None:
+            return author
+
+        key = (author, date, house)
+        if key in self.memo:
+            return self.memo[key]
+        sitting_date = (
+            date.date() if isinstance(date, datetime.datetime) else date
+        )
+        result = author
+        for rule_house, after, before, fixed_id in rules:
+            if rule_house is not None and rule_house != house.lower():
+                continue
+            if before is not None and sitting_date > before:
+                continue
+            if after is not None and sitting_date < after:
+                continue
+            result = fixed_id
+            break
+        self.memo[key] = result
+        return result
+
+
+def _to_date(value):
+    if value is None:
+        return None
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+engine = FixesEngine(fixes)
+
+
+def apply_raw_author_fixes(author, sitting_day):
+    return engine.resolve(author, sitting_day.date, sitting_day.house)
+
+
+def build_sitting_day_data(info, date_override=None) -> dict:
+    """Build the SittingDay row for a parsed chamber, with overrides applied."""
+    chamber_override = fixes["chamber_override"]
+    house_override = fixes["house_override"]
+    return {
+        "date": datetime.datetime.strptime(
+            date_override if date_override else info["date"], "%Y-%m-%d"
+        ),
+        "house": house_override.get(info["house"], info["house"]),
+        "chamber": chamber_override.get(info["chamber"], info["chamber"]),
+        "parliament": info["parliament"],
+        "session": info["session"],
+        "period": info["period"],
+    }
@@ -10,11 +10,23 @@ from scripts.politicians import main as politician_metadata
 from rich.console import Console
 from rich.progress import Progress
 from scripts.seed import seed as seed_sources
+from scripts.fixes import fixes, apply_raw_author_fixes, build_sitting_day_data
+from scripts.bulk_writer import BulkDocumentWriter, connect as bulk_connect
+from scripts.bulk_metadata import load_metadata
+from parsers.fingerprint import parser_fingerprint, content_hash
+from parsers.errors import HansardStreamingException
+from parsers.hansard_extractor import iter_documents
+from scrapers.fetch import Fetcher, prefetch
+from scrapers.cache import default_cache
 import argparse
 import json
+import collections
+from concurrent.futures import ProcessPoolExecutor
 
 console = Console()
-fixes = json.load(open("fixes.json", "r"))
+
+# Interactive transactions default to 5s, less than a long sitting day takes
+STREAM_TX_TIMEOUT = datetime.timedelta(minutes=10)
 
 # -------------------- Helpers --------------------
 
@@ -31,36 +43,6 @@ def log(msg: str) -> None:
     console.print(f"[bold green]▶[/bold green] {msg}")
 
 
-def apply_raw_author_fixes(author, sitting_day):
-    speaker_fix = fixes["speaker_alt_names"]
-    if author in speaker_fix:
-        return "10000"
-
-    for key in [author, f"_{author}"]:
-        fix = fixes["raw_author_fixes"].get(key)
-        if not fix:
-            continue
-
-        before = fix.get("before")
-        after = fix.get("after")
-        house = fix.get("house")
-
-        sitting_date_str = sitting_day.date.strftime("%Y-%m-%d")
-
-        if house is not None and house.lower() != sitting_day.house.lower():
-            continue
-
-        if before is not None and sitting_date_str > before:
-            continue
-
-        if after is not None and sitting_date_str < after:
-            continue
-
-        return fix["id"]
-
-    return author
-
-
 def raw_author_connect_or_create(name, sitting_day):
     fixed_name = apply_raw_author_fixes(name, sitting_day)
     return {
@@ -134,22 +116,9 @@ async def insert_document(db, document, raw_document_id, sitting_day):
 
 async def create_sitting_day(db, info, date_override=None) -> None:
 
-    chamber_override = fixes["chamber_override"]
-    house_override = fixes["house_override"]
     try:
         sitting_day = await db.sittingday.create(
-            data={
-                "date": datetime.datetime.strptime(
-                    date_override if date_override else info["date"], "%Y-%m-%d"
-                ),
-                "house": house_override.get(info["house"], info["house"]),
-                "chamber": chamber_override.get(
-                    info["chamber"], info["chamber"]
-                ),
-                "parliament": info["parliament"],
-                "session": info["session"],
-                "period": info["period"],
-            }
+            data=build_sitting_day_data(info, date_override)
         )
         return sitting_day
     except Exception as e:
@@ -159,6 +128,48 @@ async def create_sitting_day(db, info, date_override=None) -> None:
         raise e
 
 
+async def insert_documents(db, pairs, raw_document_id, date_override=None):
+    """
+    Write the (chamber_info, document) pairs of a parser's iter_parse(),
+    creating each chamber's sitting day when its first pair arrives.
+    """
+    chamber_info = sitting_day = None
+    for info, document in pairs:
+        if info is not chamber_info:
+            chamber_info = info
+            sitting_day = await create_sitting_day(db, info, date_override)
+        if document is not None:
+            await insert_document(db, document, raw_document_id, sitting_day)
+
+
+async def insert_streamed_documents(
+    db, parser_module, text, raw_document_id, date_override=None
+):
+    """
+    Write the documents of parser_module.iter_parse(text) as they are parsed.
+
+    The writes share one transaction. If the stream needs the whole tree
+    after it has yielded documents it raises HansardStreamingException; the
+    partial day is then rolled back and written again from parse().
+    """
+    try:
+        async with db.tx(timeout=STREAM_TX_TIMEOUT) as transaction:
+            await insert_documents(
+                transaction,
+                parser_module.iter_parse(text),
+                raw_document_id,
+                date_override,
+            )
+    except HansardStreamingException:
+        async with db.tx(timeout=STREAM_TX_TIMEOUT) as transaction:
+            await insert_documents(
+                transaction,
+                iter_documents(parser_module.parse(text)),
+                raw_document_id,
+                date_override,
+            )
+
+
 async def reset_politician_links(db: Client) -> None:
     log("Resetting politician links from raw authors...")
     await db.rawauthor.update_many(
@@ -168,13 +179,27 @@ async def reset_politician_links(db: Client) -> None:
     log("Done resetting links.")
 
 
-async def load_politician_metadata(db: Client) -> None:
+async def load_politician_metadata(db: Client, bulk: bool = False) -> None:
     log("Loading politician metadata...")
 
     ministries, parties, parliaments, parliament_intervals, politicians = (
         politician_metadata()
     )
 
+    if bulk:
+        conn = await bulk_connect()
+        try:
+            stats = await load_metadata(
+                conn, ministries, parties, parliaments, politicians
+            )
+        finally:
+            await conn.close()
+        log(
+            "Loaded metadata: "
+            + ", ".join(f"{k.replace('_', ' ')}: {v}" for k, v in stats.items())
+        )
+        return
+
     log("Inserting parties...")
     await db.party.create_many(
         [{"name": x} for x in parties], skip_duplicates=True
@@ -243,11 +268,49 @@ async def load_politician_metadata(db: Client) -> None:
     log("Finished loading metadata.")
 
 
-async def scrape_and_parse_sources(db: Client, source_id: int = None) -> None:
+async def fetch_new_documents(module, new_documents, concurrency=4, rate=2.0):
+    """
+    Yield (name, info, raw_document_text) for each new file, in order.
+
+    Scrapers with an async_scraper download up to concurrency * 2 files ahead
+    through a shared Fetcher, so downloads overlap parsing and writing.
+    Downloads go through the on-disk cache; only proofs, which are replaced
+    by the final Hansard, are revalidated with the server.
+    """
+    if not hasattr(module, "async_scraper"):
+        for name, info in new_documents.items():
+            yield name, info, module.scraper(info["path"])
+        return
+
+    async with Fetcher(
+        concurrency=concurrency, rate=rate, cache=default_cache()
+    ) as fetcher:
+        async for (name, info), raw_document_text in prefetch(
+            lambda item: module.async_scraper(
+                item[1]["path"], fetcher, revalidate=item[1]["is_proof"]
+            ),
+            new_documents.items(),
+            depth=concurrency * 2,
+        ):
+            yield name, info, raw_document_text
+
+
+async def scrape_and_parse_sources(
+    db: Client,
+    source_id: int = None,
+    bulk: bool = False,
+    fetch_concurrency: int = 4,
+    fetch_rate: float = 2.0,
+) -> None:
 
     sitting_day_override = fixes["sitting_day_override"]
     log("Scraping and parsing sources...")
 
+    writer = None
+    if bulk:
+        writer = BulkDocumentWriter(await bulk_connect(), batch_size=1)
+        await writer.load_authors()
+
     if source_id:
         sources = await db.source.find_many(where={"id": source_id})
     else:
@@ -258,7 +321,7 @@ async def scrape_and_parse_sources(db: Client, source_id: int = None) -> None:
         console.rule(f"[bold blue]{source.name}")
 
         module = importlib.import_module(source.scraperModule)
-        parser = importlib.import_module(source.parserModule).parse
+        parser_module = importlib.import_module(source.parserModule)
 
         sitting_day_override_for_source = sitting_day_override.get(
             str(source.id), {}
@@ -297,9 +360,10 @@ async def scrape_and_parse_sources(db: Client, source_id: int = None) -> None:
                     total=len(new_documents),
                 )
 
-                for name, info in new_documents.items():
+                async for name, info, raw_document_text in fetch_new_documents(
+                    module, new_documents, fetch_concurrency, fetch_rate
+                ):
                     try:
-                        raw_document_text = module.scraper(info["path"])
                         if raw_document_text:
                             raw_inserted_document = await db.rawdocument.create(
                                 data={
@@ -307,23 +371,33 @@ async def scrape_and_parse_sources(db: Client, source_id: int = None) -> None:
                                     "text": raw_document_text,
                                     "is_proof": info["is_proof"],
                                     "sourceId": source.id,
+                                    **raw_document_stamp(
+                                        source.parserModule, raw_document_text
+                                    ),
                                 }
                             )
                             override = sitting_day_override_for_source.get(
                                 raw_inserted_document.name, None
                             )
-                            parsed_document = parser(raw_inserted_document.text)
-                            for extract in parsed_document:
-                                sitting_day = await create_sitting_day(
-                                    db, extract, override
+                            if writer is not None:
+                                # batch_size=1: one transaction per RawDocument
+                                await writer.add(
+                                    raw_inserted_document.id,
+                                    parser_module.parse(
+                                        raw_inserted_document.text
+                                    ),
+                                    override,
                                 )
-                                for document in extract["documents"]:
-                                    await insert_document(
-                                        db,
-                                        document,
-                                        raw_inserted_document.id,
-                                        sitting_day,
-                                    )
+                                progress.advance(task_docs)
+                                continue
+                            # Documents are written as they are parsed
+                            await insert_streamed_documents(
+                                db,
+                                parser_module,
+                                raw_inserted_document.text,
+                                raw_inserted_document.id,
+                                override,
+                            )
                             progress.advance(task_docs)
                     except Exception as e:
                         print(e)
@@ -334,10 +408,22 @@ async def scrape_and_parse_sources(db: Client, source_id: int = None) -> None:
         else:
             console.print(f"[dim]No new files for {source.name}[/dim]")
 
+    if writer is not None:
+        await writer.conn.close()
+
     log("Finished scraping sources.")
 
 
-async def join_politicians_to_raw_authors(db: Client) -> None:
+async def join_politicians_to_raw_authors(
+    db: Client, author_ids: list = None
+) -> dict:
+    """
+    Link unlinked raw authors to parliamentarians by normalised id or alt id.
+
+    The lookup is built once and every match is written by a single UPDATE.
+    Pass author_ids to only consider those raw authors, e.g. the ones created
+    by the current ingest. Returns counts of the outcome.
+    """
     log("Joining raw authors to politicians...")
     ignore_ids = fixes["ignore_ids"]
 
@@ -352,88 +438,283 @@ async def join_politicians_to_raw_authors(db: Client) -> None:
         }
     )
 
-    authors = {
-        k.id: k
-        for k in await db.rawauthor.find_many(where={"parliamentarian": None})
+    where = {"parliamentarian": None}
+    if author_ids is not None:
+        where["id"] = {"in": list(author_ids)}
+    authors = await db.rawauthor.find_many(where=where)
+
+    matches = []
+    stats = {"authors": len(authors), "matched": 0, "unmatched": 0, "empty": 0}
+    for auth in authors:
+        auth_name_clean = normalize(auth.name)
+        if not auth_name_clean:
+            stats["empty"] += 1
+        elif auth_name_clean in politicians:
+            matches.append(
+                {"id": auth.id, "pid": politicians[auth_name_clean].id}
+            )
+        else:
+            stats["unmatched"] += 1
+            if auth.name not in ignore_ids and auth.name != "10000":
+                console.print(
+                    f"[yellow]⚠[/yellow] Could not match: {auth.name} (possible alt name)"
+                )
+
+    if matches:
+        stats["matched"] = await db.execute_raw(
+            """
+            UPDATE "rawAuthor" AS ra
+            SET "parliamentarianId" = m.pid,
+                "dateModified" = now() AT TIME ZONE 'UTC'
+            FROM json_to_recordset($1::json) AS m(id int, pid text)
+            WHERE ra.id = m.id
+            """,
+            json.dumps(matches),
+        )
+
+    log(
+        f"Finished joining authors: {stats['matched']} matched, "
+        f"{stats['unmatched']} unmatched, {stats['empty']} empty of "
+        f"{stats['authors']}."
+    )
+    return stats
+
+
+def raw_document_stamp(parser_module: str, text: str) -> dict:
+    """Return the RawDocument fields recording the parse of its text."""
+    return {
+        "parserModule": parser_module,
+        "parserVersion": parser_fingerprint(parser_module),
+        "contentHash": content_hash(text),
     }
 
-    with Progress(console=console, transient=False) as progress:
-        task = progress.add_task("Authors", total=len(authors))
-
-        for auth in authors.values():
-            auth_name_clean = normalize(auth.name)
-            if not auth_name_clean:
-                progress.advance(task)
-                continue
-            elif auth_name_clean in politicians:
-                matched_id = politicians[auth_name_clean].id
-                await db.rawauthor.update(
-                    where={"id": auth.id},
-                    data={"parliamentarian": {"connect": {"id": matched_id}}},
-                )
-            else:
-                if auth.name not in ignore_ids and auth.name != "10000":
-                    console.print(
-                        f"[yellow]⚠[/yellow] Could not match: {auth.name} (possible alt name)"
-                    )
-            progress.advance(task)
 
-    log("Finished joining authors.")
+def parse_raw_document(parser_module: str, text: str) -> list:
+    """Run a parser module over one raw document (process pool entry point)."""
+    try:
+        return importlib.import_module(parser_module).parse(text)
+    except Exception as e:
+        # Parser exceptions wrap lxml elements and do not survive pickling
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
+
+
+async def iter_raw_documents(
+    db: Client, source_id: int, batch_size: int = 100, ids: list = None
+):
+    """
+    Yield a source's raw documents in id order, batch_size texts at a time.
+
+    Pages are keyed on the last id seen rather than an offset, so only one
+    batch of raw text is held in memory however large the source is. If ids
+    is given only those raw documents are yielded.
+    """
+    if ids is not None:
+        for i in range(0, len(ids), batch_size):
+            batch = await db.rawdocument.find_many(
+                where={"id": {"in": ids[i : i + batch_size]}},
+                order={"id": "asc"},
+            )
+            for raw_doc in batch:
+                yield raw_doc
+        return
+
+    last_id = None
+    while True:
+        where = {"sourceId": source_id}
+        if last_id is not None:
+            where["id"] = {"gt": last_id}
+        batch = await db.rawdocument.find_many(
+            where=where, order={"id": "asc"}, take=batch_size
+        )
+        if not batch:
+            return
+        for raw_doc in batch:
+            yield raw_doc
+        last_id = batch[-1].id
+
+
+async def parse_in_order(parser_module, raw_documents, pool=None, window=1):
+    """
+    Yield (raw_document, parsed_document) pairs in the order given.
+
+    raw_documents is an async iterable, e.g. iter_raw_documents().
+
+    Without a pool the documents are parsed inline. With a process pool up to
+    `window` parse() calls are kept in flight while the caller writes the
+    earlier results.
+    """
+    if pool is None:
+        parser = importlib.import_module(parser_module).parse
+        async for raw_doc in raw_documents:
+            try:
+                parsed_document = parser(raw_doc.text)
+            except Exception as e:
+                console.print(f"[red]Error re-parsing {raw_doc.name}: {e}[/red]")
+                raise e
+            yield raw_doc, parsed_document
+        return
+
+    loop = asyncio.get_running_loop()
+    in_flight = collections.deque()
+
+    async def next_result():
+        raw_doc, future = in_flight.popleft()
+        try:
+            return raw_doc, await future
+        except Exception as e:
+            console.print(f"[red]Error re-parsing {raw_doc.name}: {e}[/red]")
+            raise e
+
+    async for raw_doc in raw_documents:
+        future = loop.run_in_executor(
+            pool, parse_raw_document, parser_module, raw_doc.text
+        )
+        in_flight.append((raw_doc, future))
+        if len(in_flight) >= window:
+            yield await next_result()
+
+    while in_flight:
+        yield await next_result()
+
+
+async def changed_raw_document_ids(db: Client, source) -> list:
+    """
+    Return the ids of a source's raw documents whose stored parse is stale.
+
+    A parse is stale when it was made by another parser module or version, or
+    from a different text. The text is hashed by PostgreSQL so it never
+    leaves the database.
+    """
+    rows = await db.query_raw(
+        """
+        SELECT id FROM "RawDocument"
+        WHERE "sourceId" = $1
+          AND (
+              "parserModule" IS DISTINCT FROM $2
+              OR "parserVersion" IS DISTINCT FROM $3
+              OR "contentHash" IS DISTINCT FROM
+                 encode(sha256(convert_to(text, 'UTF8')), 'hex')
+          )
+        ORDER BY id
+        """,
+        source.id,
+        source.parserModule,
+        parser_fingerprint(source.parserModule),
+    )
+    return [row["id"] for row in rows]
+
+
+async def reparse_all_sources(
+    db: Client,
+    workers: int = 1,
+    bulk: bool = False,
+    batch_size: int = 50,
+    changed_only: bool = False,
+) -> list | None:
+    """
+    Re-parse all existing raw documents.
 
+    With bulk the documents are written by a BulkDocumentWriter in
+    transactions of batch_size raw documents rather than through Prisma.
 
-async def reparse_all_sources(db: Client) -> None:
-    """Re-parse all existing raw documents."""
+    With changed_only nothing is truncated. Only the raw documents returned
+    by changed_raw_document_ids are re-parsed, and their documents are
+    replaced in the same transaction as the new ones are written.
+
+    Returns the ids of the raw authors the BulkDocumentWriter created, or
+    None when the documents were written through Prisma.
+    """
     log("Re-parsing all existing raw documents...")
 
     sitting_day_override = fixes["sitting_day_override"]
 
     sources = await db.source.find_many()
 
-    await db.query_raw('TRUNCATE "Document" CASCADE;')
-    await db.query_raw('TRUNCATE "SittingDay" CASCADE;')
-    await db.query_raw('TRUNCATE "rawAuthor" CASCADE;')
-
-    for source in sources:
-        console.rule(f"[bold blue]{source.name}")
-
-        parser = importlib.import_module(source.parserModule).parse
+    if not changed_only:
+        await db.query_raw('TRUNCATE "Document" CASCADE;')
+        await db.query_raw('TRUNCATE "SittingDay" CASCADE;')
+        await db.query_raw('TRUNCATE "rawAuthor" CASCADE;')
 
-        raw_documents = await db.rawdocument.find_many(
-            where={"sourceId": source.id},
+    writer = None
+    if bulk or changed_only:
+        writer = BulkDocumentWriter(
+            await bulk_connect(), batch_size, replace=changed_only
         )
+        await writer.load_authors()
 
-        sitting_day_override_for_source = sitting_day_override.get(
-            str(source.id), {}
-        )
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for source in sources:
+            console.rule(f"[bold blue]{source.name}")
+
+            if changed_only:
+                ids = await changed_raw_document_ids(db, source)
+                total = len(ids)
+                if not ids:
+                    console.print(f"[dim]No changes for {source.name}[/dim]")
+                    continue
+            else:
+                ids = None
+                total = await db.rawdocument.count(
+                    where={"sourceId": source.id}
+                )
 
-        with Progress(console=console, transient=False) as progress:
-            task_docs = progress.add_task(
-                f"[green]Re-parsing {source.name}[/green]",
-                total=len(raw_documents),
+            sitting_day_override_for_source = sitting_day_override.get(
+                str(source.id), {}
             )
 
-            for raw_doc in raw_documents:
-                try:
-                    parsed_document = parser(raw_doc.text)
-                    for extract in parsed_document:
+            with Progress(console=console, transient=False) as progress:
+                task_docs = progress.add_task(
+                    f"[green]Re-parsing {source.name}[/green]",
+                    total=total,
+                )
+
+                # Parsing happens in the pool, this loop is the single writer
+                async for raw_doc, parsed_document in parse_in_order(
+                    source.parserModule,
+                    iter_raw_documents(db, source.id, ids=ids),
+                    pool,
+                    window=workers * 2,
+                ):
+                    try:
                         override = sitting_day_override_for_source.get(
                             raw_doc.name, None
                         )
-                        sitting_day = await create_sitting_day(
-                            db, extract, override
+                        stamp = raw_document_stamp(
+                            source.parserModule, raw_doc.text
                         )
-                        for document in extract["documents"]:
-                            await insert_document(
-                                db, document, raw_doc.id, sitting_day
+                        if writer is not None:
+                            await writer.add(
+                                raw_doc.id, parsed_document, override, stamp
                             )
-                except Exception as e:
-                    console.print(
-                        f"[red]Error re-parsing {raw_doc.name}: {e}[/red]"
-                    )
-                    raise e
-                progress.advance(task_docs)
+                            progress.advance(task_docs)
+                            continue
+                        await insert_documents(
+                            db,
+                            iter_documents(parsed_document),
+                            raw_doc.id,
+                            override,
+                        )
+                        await db.rawdocument.update(
+                            where={"id": raw_doc.id}, data=stamp
+                        )
+                    except Exception as e:
+                        console.print(
+                            f"[red]Error re-parsing {raw_doc.name}: {e}[/red]"
+                        )
+                        raise e
+                    progress.advance(task_docs)
+
+            if writer is not None:
+                await writer.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if writer is not None:
+            await writer.conn.close()
 
     log("Finished re-parsing all sources.")
+    return writer.new_author_ids if writer is not None else None
 
 
 async def check_authors_join(db):
@@ -539,6 +820,42 @@ async def main():
     parser.add_argument(
         "--source-id", type=int, help="Only process this specific source ID."
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to parse with during --reparse.",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Write documents and politician metadata with set-based SQL "
+        "(COPY, bulk upserts) instead of one Prisma call per row.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50,
+        help="Raw documents per transaction when --reparse --bulk.",
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="With --reparse, only re-parse raw documents whose parser "
+        "fingerprint or text hash changed.",
+    )
+    parser.add_argument(
+        "--fetch-concurrency",
+        type=int,
+        default=4,
+        help="Maximum simultaneous downloads when scraping.",
+    )
+    parser.add_argument(
+        "--fetch-rate",
+        type=float,
+        default=2.0,
+        help="Maximum download requests per second when scraping.",
+    )
     args = parser.parse_args()
 
     console.rule("[bold blue]Pipeline Start")
@@ -546,15 +863,26 @@ async def main():
     await db.connect()
 
     await seed_sources(db)
-    await reset_politician_links(db)
 
     if args.reparse:
-        await reparse_all_sources(db)
+        # The politicians are not reloaded, so existing links stay valid and
+        # only the raw authors this run created need joining
+        author_ids = await reparse_all_sources(
+            db, args.workers, args.bulk, args.batch_size, args.changed_only
+        )
     else:
-        await load_politician_metadata(db)
-        await scrape_and_parse_sources(db, args.source_id)
+        author_ids = None
+        await reset_politician_links(db)
+        await load_politician_metadata(db, args.bulk)
+        await scrape_and_parse_sources(
+            db,
+            args.source_id,
+            args.bulk,
+            args.fetch_concurrency,
+            args.fetch_rate,
+        )
 
-    await join_politicians_to_raw_authors(db)
+    await join_politicians_to_raw_authors(db, author_ids)
     await check_authors_join(db)
 
     await db.disconnect()
@@ -0,0 +1,6 @@
+"""
+Benchmarks package - timing scripts for parser hot paths.
+
+Each file in this package is a standalone script.
+Run with: python3 tests/benchmarks/<name>.py
+"""
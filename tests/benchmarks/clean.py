@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark for HansardExtractor cleaning.
+
+Compares the legacy clean (six regex passes, HTML parse, serialise to XML and
+reparse) with the direct repaired tree returned by _repair_hansard.
+
+Run with: python3 tests/benchmarks/clean.py
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+from lxml import html
+import lxml.etree as ET
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from parsers.hansard_extractor import HansardExtractor
+
+TESTS_DIR = Path(__file__).parent.parent / "xml"
+REPEATS = 3
+
+
+def legacy_clean(string):
+    """The cleaning path as it was before _repair_hansard."""
+    lines = string.split("\n")
+    for i, line in enumerate(lines):
+        if "<hansard" in line.lower():
+            string = "\n".join(lines[i:])
+            break
+    for k, v in {"&mdash;": "---", "&nbsp;": " "}.items():
+        string = string.replace(k, v)
+    string = re.sub(r"<(/?)(mc|v|o|w10|w|o14|m):[^>]*>", "", string)
+    string = re.sub(r'\s(xmlns:[a-zA-Z0-9]+)="[^"]+"', "", string)
+    string = re.sub(r'\s[a-zA-Z0-9]+:[a-zA-Z0-9\-]+="[^"]*"', "", string)
+    string = re.sub(r"<BREAK[^>]*>", "", string, flags=re.IGNORECASE)
+    string = re.sub(r"<TAB[^>]*>", "", string, flags=re.IGNORECASE)
+    repaired = html.fromstring(string)
+    ET.strip_tags(repaired, ET.Comment)
+    fixed_xml = html.tostring(repaired, method="xml").decode()
+    return ET.fromstring(fixed_xml)
+
+
+def best_of(func, text):
+    """Return the best wall time (seconds) over REPEATS runs."""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    files = sorted(TESTS_DIR.glob("*.xml"))
+    print(f"{'File':<10}  {'Size (KB)':>9}  {'Before (ms)':>11}  {'After (ms)':>10}  {'Speedup':>7}")
+    print("-" * 55)
+
+    total_before = 0.0
+    total_after = 0.0
+    for path in files:
+        text = path.read_text()
+        before = best_of(legacy_clean, text)
+        after = best_of(HansardExtractor._repair_hansard, text)
+        total_before += before
+        total_after += after
+        print(
+            f"{path.stem:<10}  {len(text) / 1024:>9.0f}  {before * 1000:>11.2f}"
+            f"  {after * 1000:>10.2f}  {before / after:>6.2f}x"
+        )
+
+    print("-" * 55)
+    print(
+        f"{'TOTAL':<10}  {'':>9}  {total_before * 1000:>11.2f}"
+        f"  {total_after * 1000:>10.2f}  {total_before / total_after:>6.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the modern era span lookups.
+
+Compares the legacy lookups (a findall(".//span") scan per paragraph to
+classify it, a findall per class to pull inline text, and an xpath
+contains() per member interjection) with the per-talk.text span index, by
+classifying every paragraph of every talk.text in the 2011-present fixtures
+and pulling the text of its inline interjections.
+
+Run with: python3 tests/benchmarks/modern_spans.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from lxml import html
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from parsers.hansard2011 import SpeechExtractor2011
+from parsers.hansard2012 import SpeechExtractor2012
+from parsers.hansard2021 import SpeechExtractor2021
+from tests.run_report import get_all_test_files, get_parser_for_file
+
+REPEATS = 5
+ROLES = ["SPEAKER", "DEPUTY", "CLERK", "PRESIDENT", "CHAIR"]
+
+
+class LegacyLookups:
+    """The span lookups as they were before the span index."""
+
+    def _index_spans(self, talk_text):
+        pass
+
+    def _spans_with_class(self, elem, *classes):
+        spans = []
+        for class_attr in classes:
+            spans += elem.findall(f'.//span[@class="{class_attr}"]')
+        return spans
+
+    def _spans_with_class_containing(self, elem, fragment):
+        return elem.xpath(f".//span[contains(@class, '{fragment}')]")
+
+    def _is_interjection_element(self, et_elem):
+        for span in et_elem.findall(".//span"):
+            class_attr = span.get("class", "")
+            if class_attr in [
+                "HPS-OfficeInterjecting",
+                "HPS-OfficeContinuation",
+                "HPS-OfficeSpeech",
+                "HPS-MemberIInterjecting",
+                "HPS-GeneralIInterjecting",
+                "HPS-MemberInterjecting",
+                "HPS-GeneralInterjecting",
+            ]:
+                if span.text and span.text.strip():
+                    return True, True
+            elif class_attr in {"HPS-MemberSpeech"}:
+                text = span.text
+                if text and any(role in text for role in ROLES):
+                    return True, True
+        return False, False
+
+
+class Legacy2011(LegacyLookups, SpeechExtractor2011):
+    def _is_interjection_element(self, et_elem):
+        for span in et_elem.findall(".//span"):
+            class_attr = span.get("class", "")
+            if class_attr in [
+                "HPS-MemberIInterjecting",
+                "HPS-GeneralIInterjecting",
+                "HPS-MemberInterjecting",
+                "HPS-GeneralInterjecting",
+                "HPS-OfficeInterjecting",
+            ]:
+                return True, True
+            elif class_attr in {"HPS-MemberContinuation", "HPS-MemberSpeech"}:
+                text = span.text
+                if text and any(role in text for role in ROLES):
+                    return True, True
+        return False, False
+
+
+class Legacy2012(LegacyLookups, SpeechExtractor2012):
+    pass
+
+
+class Legacy2021(LegacyLookups, SpeechExtractor2021):
+    pass
+
+
+ERAS = {
+    "parsers.hansard2011": (Legacy2011, SpeechExtractor2011),
+    "parsers.hansard2012": (Legacy2012, SpeechExtractor2012),
+    "parsers.hansard2021": (Legacy2021, SpeechExtractor2021),
+}
+
+
+def load_talk_texts():
+    """Return [(legacy class, current class, talk.text)] for the fixtures."""
+    talk_texts = []
+    for test_file in get_all_test_files():
+        parser = get_parser_for_file(test_file)
+        if parser is None or parser.__name__ not in ERAS:
+            continue
+        legacy, current = ERAS[parser.__name__]
+        tree = html.fromstring(test_file.read_bytes())
+        for talk_text in tree.iter("talk.text"):
+            talk_texts.append((legacy, current, talk_text))
+    return talk_texts
+
+
+def lookups(cls, talk_text):
+    """Classify each paragraph of talk_text, pulling inline interjections."""
+    extractor = cls(talk_text.getparent())
+    extractor._index_spans(talk_text)
+    results = []
+    for para in talk_text:
+        try:
+            flag, is_inline = extractor._interjection_flag(para)
+        except Exception as e:
+            results.append(type(e).__name__)
+            continue
+        text = extractor._pull_inline_paras(para) if is_inline else None
+        results.append((flag, is_inline, text))
+    return results
+
+
+def best_of(talk_texts, pick):
+    """Best wall time (seconds) over REPEATS passes over every talk.text."""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for classes in talk_texts:
+            lookups(pick(classes), classes[2])
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    talk_texts = load_talk_texts()
+    paras = sum(len(talk_text) for _, _, talk_text in talk_texts)
+    same = all(
+        lookups(legacy, talk_text) == lookups(current, talk_text)
+        for legacy, current, talk_text in talk_texts
+    )
+    before = best_of(talk_texts, lambda classes: classes[0])
+    after = best_of(talk_texts, lambda classes: classes[1])
+
+    print(f"talk.text: {len(talk_texts)} ({paras} paragraphs)")
+    print(f"Same:      {same}")
+    print(f"Before:    {before * 1000:.1f} ms")
+    print(f"After:     {after * 1000:.1f} ms")
+    print(f"Speedup:   {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark for question/answer pairing in ChamberSpeechExtractor.
+
+Compares the legacy _extract_elements (rescan the parent's children for
+every question, then a second pass over every element for orphan answers)
+with the single-pass pairing, on the answers to questions chamber of the
+largest such fixture.
+
+Run with: python3 tests/benchmarks/qa_pairing.py [fixture.xml]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from parsers.chamber_speech_extractor import ChamberSpeechExtractor
+from parsers.errors import HansardNoElementsException
+from parsers.hansard_extractor import HansardExtractor
+
+TESTS_DIR = Path(__file__).parent.parent / "xml"
+FIXTURE = "1970.xml"  # most questions and answers in answers.to.questions
+REPEATS = 20
+
+
+def legacy_extract_elements(self):
+    """_extract_elements as it was before the single-pass pairing."""
+    check_elements = self.root.xpath(".//speech | .//question | .//answer")
+    if not check_elements:
+        raise HansardNoElementsException("No parsable Elements")
+
+    elements = []
+    raw_elements = list(self.root.iter())
+    used_answers = set()
+
+    for el in raw_elements:
+        tag = el.tag.lower()
+        if tag == "question":
+            parent = el.getparent()
+            found_el = False
+            answer = None
+            for child in parent:
+                if child is el:
+                    found_el = True
+                    continue
+                if found_el and child.tag.lower() == "answer":
+                    answer = child
+                    break
+
+            if answer is not None:
+                elements.append(
+                    {
+                        "type": "question",
+                        "question": self._clean_element(el),
+                        "answer": self._clean_element(answer),
+                    }
+                )
+                used_answers.add(id(answer))
+            else:
+                elements.append(
+                    {"type": "question", "question": self._clean_element(el)}
+                )
+        elif tag == "speech":
+            elements.append(
+                {"type": "speech", "element": self._clean_element(el)}
+            )
+
+    for el in raw_elements:
+        if el.tag.lower() == "answer" and id(el) not in used_answers:
+            elements.append({"type": "answer", "element": self._clean_element(el)})
+    return elements
+
+
+def best_of(func, extractor):
+    """Return the best wall time (seconds) over REPEATS runs."""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(extractor)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    path = TESTS_DIR / (sys.argv[1] if len(sys.argv) > 1 else FIXTURE)
+    hansard = HansardExtractor(path.read_text(), ChamberSpeechExtractor, None)
+    chamber = hansard._get_distinct_chambers()["answers.to.questions"]
+    extractor = ChamberSpeechExtractor(chamber, None, None)
+
+    before = legacy_extract_elements(extractor)
+    after = extractor._extract_elements()
+    same = [(e["type"], [id(v) for v in e.values()]) for e in before] == [
+        (e["type"], [id(v) for v in e.values()]) for e in after
+    ]
+
+    legacy = best_of(legacy_extract_elements, extractor)
+    current = best_of(ChamberSpeechExtractor._extract_elements, extractor)
+    questions = sum(1 for _ in chamber.iter("question"))
+    answers = sum(1 for _ in chamber.iter("answer"))
+
+    print(f"Fixture:   {path.name} ({questions} questions, {answers} answers)")
+    print(f"Elements:  {len(after)} (same as legacy: {same})")
+    print(f"Before:    {legacy * 1000:.2f} ms")
+    print(f"After:     {current * 1000:.2f} ms")
+    print(f"Speedup:   {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
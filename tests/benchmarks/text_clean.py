@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the speech text cleaners.
+
+Records every string the fixtures pass to _clean_text, per era, then times
+the legacy cleaners (patterns compiled and title lists built on each call,
+two regex passes for the base clean) against the current ones that use
+parsers.text. Also times the per-paragraph punctuation stripping of
+earlydigital._is_interjection_element with and without a prebuilt table.
+
+Run with: python3 tests/benchmarks/text_clean.py
+"""
+
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from parsers.eras import (
+    SpeechExtractorEarlyDigital,
+    SpeechExtractorMassDigitisation,
+)
+from parsers.speech_extractor import SpeechExtractor
+from parsers.text import STRIP_PUNCTUATION
+from tests.run_report import get_all_test_files, get_parser_for_file
+
+REPEATS = 5
+
+
+def legacy_base_clean(text):
+    """SpeechExtractor._clean_text before parsers.text."""
+    text = re.sub(r"^[^a-zA-Z0-9[]+", "", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+def legacy_massdigitisation_clean(text):
+    """SpeechExtractorMassDigitisation._clean_text before parsers.text."""
+    text = legacy_base_clean(text)
+    text = text.lstrip()
+    title_indicators = [
+        "Mr",
+        "Mrs",
+        "Ms",
+        "Dr",
+        "Senator",
+        "Sir",
+        "Madam",
+        "Hon",
+    ]
+    bracket_title_pattern = r"^(?:\[|\()([^\]\)]+)(?:\]|\))"
+    match = re.match(bracket_title_pattern, text)
+    if match:
+        if any(ti in match.group(1) for ti in title_indicators):
+            text = text[match.end() :]
+    for dash in ["-", "—"]:
+        if dash in text:
+            parts = text.split(dash, 1)
+            before = parts[0].strip()
+            after = parts[1].strip()
+            has_title = any(ti in before for ti in title_indicators)
+            if (
+                has_title
+                and len(re.sub(r"[^a-zA-Z0-9]", "", before)) < 25
+                and len(re.sub(r"[^a-zA-Z0-9]", "", after)) > 5
+                and "INTERJECTION" not in before
+            ):
+                text = after
+                break
+    return legacy_base_clean(text)
+
+
+def legacy_earlydigital_clean(text):
+    """SpeechExtractorEarlyDigital._clean_text before parsers.text."""
+    bracket_title_pattern = r"^(?:\[|\()([^\]\)]+)(?:\]|\))\s*"
+    match = re.match(bracket_title_pattern, text)
+    if match:
+        title_indicators = [
+            "Mr",
+            "Mrs",
+            "Ms",
+            "Dr",
+            "Senator",
+            "Sir",
+            "Madam",
+            "Hon",
+        ]
+        if any(ti in match.group(1) for ti in title_indicators):
+            text = text[match.end() :]
+    if "---" in text:
+        parts = text.split("---", 1)
+        before = parts[0].strip()
+        after = parts[1].strip()
+        title_indicators = [
+            "Mr",
+            "Mrs",
+            "Ms",
+            "Dr",
+            "Senator",
+            "Sir",
+            "Madam",
+            "Hon",
+        ]
+        has_title = any(ti in before for ti in title_indicators)
+        if has_title and len(before) < 60:
+            text = after
+    return legacy_base_clean(text)
+
+
+CLEANERS = [
+    ("base", SpeechExtractor, legacy_base_clean),
+    (
+        "massdigitisation",
+        SpeechExtractorMassDigitisation,
+        legacy_massdigitisation_clean,
+    ),
+    ("earlydigital", SpeechExtractorEarlyDigital, legacy_earlydigital_clean),
+]
+
+
+def record_inputs():
+    """Parse every fixture, returning the _clean_text inputs of each era."""
+    inputs = {name: [] for name, _, _ in CLEANERS}
+    originals = {}
+    recording_methods = {}
+    for name, cls, _ in CLEANERS:
+        original = cls.__dict__["_clean_text"]
+        originals[cls] = original
+
+        def recording(self, text, _name=name, _original=original):
+            # Only the outermost era's call, not the super() chain
+            if type(self)._clean_text is recording_methods[_name]:
+                inputs[_name].append(text)
+            return _original(self, text)
+
+        recording_methods[name] = recording
+        setattr(cls, "_clean_text", recording)
+
+    try:
+        for test_file in get_all_test_files():
+            parser = get_parser_for_file(test_file)
+            if parser is not None:
+                parser.parse(test_file.read_text())
+    finally:
+        for cls, original in originals.items():
+            setattr(cls, "_clean_text", original)
+    return inputs
+
+
+def best_per_call(func, texts):
+    """Best time per call (ns) over REPEATS passes over texts."""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(texts) * 1e9
+
+
+def report(name, legacy, current, texts):
+    same = all(legacy(t) == current(t) for t in texts)
+    before = best_per_call(legacy, texts)
+    after = best_per_call(current, texts)
+    print(
+        f"{name:<22} {len(texts):>8}  {before:>9.0f}  {after:>9.0f}"
+        f"  {before / after:>6.2f}x  {same}"
+    )
+
+
+def main():
+    inputs = record_inputs()
+    print(
+        f"{'Cleaner':<22} {'Calls':>8}  {'Before ns':>9}  {'After ns':>9}"
+        f"  {'Speedup':>7}  Same"
+    )
+    for name, cls, legacy in CLEANERS:
+        texts = inputs[name]
+        if not texts:
+            continue
+        extractor = cls.__new__(cls)
+        report(name, legacy, extractor._clean_text, texts)
+
+    # Paragraph text as earlydigital._is_interjection_element strips it
+    paragraphs = inputs["earlydigital"] or inputs["base"]
+    report(
+        "strip punctuation",
+        lambda t: t.translate(str.maketrans("", "", string.punctuation)),
+        lambda t: t.translate(STRIP_PUNCTUATION),
+        paragraphs,
+    )
+
+
+if __name__ == "__main__":
+    main()
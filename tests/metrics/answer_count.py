@@ -2,10 +2,10 @@
 Metric: Answer count.
 """
 
-from .base import CountMetric
+from .base import CountMetric, VisitorMetric
 
 
-class AnswerCountMetric(CountMetric):
+class AnswerCountMetric(CountMetric, VisitorMetric):
     @property
     def name(self) -> str:
         return "answers"
@@ -18,12 +18,9 @@ class AnswerCountMetric(CountMetric):
     def description(self) -> str:
         return "Number of answers (standalone answers or questions with answers)"
     
-    def count(self, documents: list) -> int:
-        count = 0
-        for d in documents:
-            t = d.get("type", "")
-            if t == "question" and "answer" in d:
-                count += 1
-            elif t == "answer":
-                count += 1
-        return count
+    def visit_document(self, document, view):
+        t = document.get("type", "")
+        if t == "question" and "answer" in document:
+            self.total += 1
+        elif t == "answer":
+            self.total += 1
@@ -2,22 +2,12 @@
 Metric: "interjecting" in wrong interjection types.
 """
 
-from .base import IssueMetric
+from .base import IssueMetric, VisitorMetric
 
 
-def get_all_interjections(documents):
-    """Get all interjections from documents and answers."""
-    return [
-        ij
-        for d in documents
-        for ij in d.get("interjections", [])
-        + d.get("answer", {}).get("interjections", [])
-    ]
-
-
-class BadInterjectingTypesMetric(IssueMetric):
+class BadInterjectingTypesMetric(IssueMetric, VisitorMetric):
     """Find interjections with 'interjecting' text in wrong types."""
-    
+
     @property
     def name(self) -> str:
         return "bad_interjecting"
@@ -30,9 +20,9 @@ class BadInterjectingTypesMetric(IssueMetric):
     def description(self) -> str:
         return "'interjecting' text found in non-type2/non-type4/non-type5 interjections"
     
-    def find_issues(self, documents: list) -> list:
-        return [
-            ij for ij in get_all_interjections(documents)
-            if ij.get("type") not in [2, 4, 5]
-            and "members interjecting" in ij.get("text", "").lower()
-        ]
+    def visit_interjection(self, document, view, where):
+        if (
+            view.item.get("type") not in [2, 4, 5]
+            and "members interjecting" in view.lower
+        ):
+            self.issues.append(view.item)
@@ -2,6 +2,9 @@
 Base metric class for parser diagnostics.
 
 Each metric should inherit from Metric and implement the `run` method.
+Count and issue metrics can instead also inherit from VisitorMetric and
+implement the visit_* hooks, so tests.metrics.engine.MetricEngine runs them
+in a single walk over the documents shared with every other visitor metric.
 """
 
 from abc import ABC, abstractmethod
@@ -64,6 +67,28 @@ class Metric(ABC):
         """
         pass
 
+    # Whether the metric is run by the visit_* hooks below (VisitorMetric)
+    visitor = False
+
+    def start(self) -> None:
+        """Reset what the hooks collect, before a walk over the documents."""
+        pass
+
+    def visit_document(self, document: dict, view) -> None:
+        """Called for every document, view being its TextView."""
+        pass
+
+    def visit_answer(self, document: dict, view) -> None:
+        """Called for the answer of a document that has one."""
+        pass
+
+    def visit_interjection(self, document: dict, view, where: str) -> None:
+        """
+        Called for every interjection of a document (where is
+        "interjection") and of its answer ("answer_interjection").
+        """
+        pass
+
     def get_examples(
         self, items: list, max_examples: int = 5, max_text_len: int = 60
     ) -> list:
@@ -82,9 +107,45 @@ class Metric(ABC):
         return []
 
 
+class VisitorMetric(Metric):
+    """
+    A metric run by its visit_* hooks. List it after CountMetric or
+    IssueMetric in the bases, so their finish() is used.
+    """
+
+    visitor = True
+
+    @abstractmethod
+    def finish(self) -> MetricResult:
+        """Return the result of what the hooks collected."""
+        pass
+
+    def walk(self, documents: list) -> None:
+        """Run this metric's hooks over documents on its own."""
+        from .engine import MetricEngine
+
+        self.start()
+        errors = MetricEngine.walk(documents, [self])
+        if errors:
+            raise errors[self]
+
+
+def _require_override(cls, base, method):
+    """Raise TypeError if cls is neither a visitor nor overrides method."""
+    if not cls.visitor and getattr(cls, method) is getattr(base, method):
+        raise TypeError(
+            f"{cls.__name__} must implement {method}() or inherit from "
+            "VisitorMetric"
+        )
+
+
 class CountMetric(Metric):
     """Base class for metrics that simply count something."""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _require_override(cls, CountMetric, "count")
+
     @property
     def severity(self) -> str:
         return "info"
@@ -100,15 +161,31 @@ class CountMetric(Metric):
             severity=self.severity,
         )
 
-    @abstractmethod
     def count(self, documents: list) -> int:
-        """Return the count of items."""
-        pass
+        """Return the count of items, by walking them for a visitor."""
+        self.walk(documents)
+        return self.total
+
+    def start(self) -> None:
+        self.total = 0
+
+    def finish(self) -> MetricResult:
+        return MetricResult(
+            name=self.name,
+            display_name=self.display_name,
+            description=self.description,
+            count=self.total,
+            severity=self.severity,
+        )
 
 
 class IssueMetric(Metric):
     """Base class for metrics that detect issues (with examples)."""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _require_override(cls, IssueMetric, "find_issues")
+
     @property
     def severity(self) -> str:
         return "warning"
@@ -125,7 +202,20 @@ class IssueMetric(Metric):
             severity=self.severity,
         )
 
-    @abstractmethod
     def find_issues(self, documents: list) -> list:
-        """Return list of issues found."""
-        pass
+        """Return list of issues found, by walking them for a visitor."""
+        self.walk(documents)
+        return self.issues
+
+    def start(self) -> None:
+        self.issues = []
+
+    def finish(self) -> MetricResult:
+        return MetricResult(
+            name=self.name,
+            display_name=self.display_name,
+            description=self.description,
+            count=len(self.issues),
+            examples=self.get_examples(self.issues),
+            severity=self.severity,
+        )
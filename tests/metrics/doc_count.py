@@ -2,10 +2,10 @@
 Metric: Total document count.
 """
 
-from .base import CountMetric
+from .base import CountMetric, VisitorMetric
 
 
-class DocumentCountMetric(CountMetric):
+class DocumentCountMetric(CountMetric, VisitorMetric):
     @property
     def name(self) -> str:
         return "docs"
@@ -18,5 +18,5 @@ class DocumentCountMetric(CountMetric):
     def description(self) -> str:
         return "Total number of documents parsed from the XML"
     
-    def count(self, documents: list) -> int:
-        return len(documents)
+    def visit_document(self, document, view):
+        self.total += 1
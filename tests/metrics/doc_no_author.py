@@ -2,12 +2,12 @@
 Metric: Documents with empty author.
 """
 
-from .base import IssueMetric
+from .base import IssueMetric, VisitorMetric
 
 
-class EmptyDocAuthorMetric(IssueMetric):
+class EmptyDocAuthorMetric(IssueMetric, VisitorMetric):
     """Find documents with no author field."""
-    
+
     @property
     def name(self) -> str:
         return "doc_no_author"
@@ -20,5 +20,6 @@ class EmptyDocAuthorMetric(IssueMetric):
     def description(self) -> str:
         return "Documents (speeches/questions/answers) with no author field"
     
-    def find_issues(self, documents: list) -> list:
-        return [d for d in documents if not d.get("author")]
+    def visit_document(self, document, view):
+        if not document.get("author"):
+            self.issues.append(document)
@@ -0,0 +1,241 @@
+"""
+Single-pass metric engine.
+
+MetricEngine walks the documents of a parsed result once, and calls the
+visit_* hooks of every visitor metric for each document, answer and
+interjection. The values several metrics derive from the same text (the
+leading words, title and time pattern matches, lower case) are computed
+once per item by TextView.
+
+Metrics that count or find issues by walking the documents themselves
+(visitor = False) run through an adapter that calls their own run().
+
+ChamberMetricEngine scores every chamber of a sitting day as the chambers
+stream past, giving results per chamber and for the day as a whole.
+"""
+
+import re
+from functools import cached_property
+
+from .base import Metric, MetricResult
+
+# Titles (e.g., "Senator SMITH", "Mr WATT") - only when name is ALL CAPS.
+# The lookahead skips positions no title starts at before the alternation is
+# tried, which is most of the time spent searching whole speeches.
+TITLE_PATTERN = re.compile(
+    r"(?=[MDSH])\b(Mr|Mrs|Ms|Dr|Senator|Sir|Madam|Hon)\s+[A-Z]{2,}\b"
+)
+# Titles at START of text followed by ALL CAPS name and -
+TITLE_AT_START_PATTERN = re.compile(
+    r"^(Mr|Mrs|Ms|Dr|Senator|Sir|Madam|Hon)\s+[A-Z]{2,}.*?\s*-\s*"
+)
+TIME_IN_BRACKETS_PATTERN = re.compile(
+    r"[\[\(][^\]\)]*\d{1,2}[.:]\d{2}\s*(am|pm|a\.m\.|p\.m\.)", re.IGNORECASE
+)
+
+
+class TextView:
+    """The text of a document, answer or interjection, and what is derived
+    from it, each computed the first time a metric asks for it."""
+
+    def __init__(self, item):
+        self.item = item
+        self.text = item.get("text", "")
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def leading_words(self):
+        """The first 10 words, joined by single spaces."""
+        if not self.text:
+            return ""
+        return " ".join(self.text.split(maxsplit=10)[:10])
+
+    @cached_property
+    def title_match(self):
+        return TITLE_PATTERN.search(self.text)
+
+    @cached_property
+    def title_at_start(self):
+        if not self.text:
+            return None
+        return TITLE_AT_START_PATTERN.match(self.text[:80])
+
+    @cached_property
+    def time_in_brackets(self):
+        """A bracketed time in the first 10 words."""
+        if not self.text:
+            return None
+        return TIME_IN_BRACKETS_PATTERN.search(self.leading_words)
+
+
+def _hooks(metrics, hook):
+    """(metric, bound hook) for the metrics that override a visit_* hook."""
+    return [
+        (metric, getattr(metric, hook))
+        for metric in metrics
+        if getattr(type(metric), hook) is not getattr(Metric, hook)
+    ]
+
+
+def _results(metrics, errors, parsed_result) -> dict:
+    """
+    Results of metrics whose hooks have run, in order. Metrics that are not
+    visitors are run on parsed_result here.
+    """
+    results = {}
+    for metric in metrics:
+        try:
+            if not metric.visitor:
+                # Adapter for metrics that walk the documents themselves
+                result = metric.run(parsed_result)
+            elif metric in errors:
+                raise errors[metric]
+            else:
+                result = metric.finish()
+            results[result.name] = result
+        except Exception as e:
+            results[metric.name] = {"error": str(e)}
+    return results
+
+
+class MetricEngine:
+    """Runs metrics over a parsed result in one walk over its documents."""
+
+    def __init__(self, metrics):
+        self.metrics = list(metrics)
+
+    def run(self, parsed_result) -> dict:
+        """
+        Return {metric name: MetricResult} in the order of the metrics, with
+        {"error": message} for a metric that raised.
+        """
+        visitors = [m for m in self.metrics if m.visitor]
+        errors = {}
+        for metric in visitors:
+            metric.start()
+        if visitors:
+            documents = visitors[0].get_documents(parsed_result)
+            self.walk(documents, visitors, errors)
+        return _results(self.metrics, errors, parsed_result)
+
+    @staticmethod
+    def walk(documents, metrics, errors=None):
+        """
+        Call the hooks of metrics for every document, then each of its
+        interjections, its answer and the answer's interjections. A metric
+        that raises is recorded in errors and not called again.
+        """
+        errors = {} if errors is None else errors
+        on_document = _hooks(metrics, "visit_document")
+        on_answer = _hooks(metrics, "visit_answer")
+        on_interjection = _hooks(metrics, "visit_interjection")
+
+        def dispatch(hooks, *args):
+            for metric, hook in hooks:
+                if metric in errors:
+                    continue
+                try:
+                    hook(*args)
+                except Exception as e:
+                    errors[metric] = e
+
+        for document in documents:
+            if on_document:
+                dispatch(on_document, document, TextView(document))
+            if on_interjection:
+                for ij in document.get("interjections", []):
+                    dispatch(
+                        on_interjection, document, TextView(ij), "interjection"
+                    )
+            if "answer" not in document:
+                continue
+            answer = document["answer"]
+            if on_answer:
+                dispatch(on_answer, document, TextView(answer))
+            if on_interjection:
+                for ij in answer.get("interjections", []):
+                    dispatch(
+                        on_interjection,
+                        document,
+                        TextView(ij),
+                        "answer_interjection",
+                    )
+        return errors
+
+
+class ChamberMetricEngine:
+    """
+    Scores the chambers of a sitting day one at a time, in a single walk
+    over each chamber's documents.
+
+    Each chamber is scored by fresh metric instances, and the same walk
+    feeds a second set of instances that accumulate over every chamber.
+    Metrics that are not visitors are run on each chamber through the
+    adapter, and their day results are the sum of the chamber counts and
+    the chamber examples in order.
+    """
+
+    def __init__(self, metric_classes):
+        self.metric_classes = list(metric_classes)
+        self.totals = [cls() for cls in self.metric_classes]
+        self.errors = {}
+        self.chambers = []
+        for metric in self.totals:
+            if metric.visitor:
+                metric.start()
+
+    def add(self, chamber) -> dict:
+        """Score one chamber dict, returning its results."""
+        metrics = [cls() for cls in self.metric_classes]
+        visitors = [m for m in metrics if m.visitor]
+        for metric in visitors:
+            metric.start()
+        parsed_result = [chamber]
+        documents = metrics[0].get_documents(parsed_result) if metrics else []
+        MetricEngine.walk(
+            documents,
+            visitors + [m for m in self.totals if m.visitor],
+            self.errors,
+        )
+        results = _results(metrics, self.errors, parsed_result)
+        self.chambers.append((chamber.get("chamber"), results))
+        return results
+
+    def results(self) -> dict:
+        """Results over every chamber added so far."""
+        results = _results(
+            [m for m in self.totals if m.visitor], self.errors, None
+        )
+        combined = {}
+        for metric in self.totals:
+            if metric.visitor:
+                result = results[metric.name]
+            else:
+                result = self._combine(
+                    metric,
+                    [chamber[metric.name] for _, chamber in self.chambers],
+                )
+            combined[metric.name] = result
+        return combined
+
+    @staticmethod
+    def _combine(metric, results):
+        if not results:
+            try:
+                return metric.run([])
+            except Exception as e:
+                return {"error": str(e)}
+        for result in results:
+            if isinstance(result, dict):
+                return result
+        return MetricResult(
+            name=results[0].name,
+            display_name=results[0].display_name,
+            description=results[0].description,
+            count=sum(result.count for result in results),
+            examples=[e for result in results for e in result.examples],
+            severity=results[0].severity,
+        )
@@ -2,20 +2,10 @@
 Metric: Total interjection count.
 """
 
-from .base import CountMetric
+from .base import CountMetric, VisitorMetric
 
 
-def get_all_interjections(documents):
-    """Get all interjections from documents and answers."""
-    return [
-        ij
-        for d in documents
-        for ij in d.get("interjections", [])
-        + d.get("answer", {}).get("interjections", [])
-    ]
-
-
-class InterjectionCountMetric(CountMetric):
+class InterjectionCountMetric(CountMetric, VisitorMetric):
     @property
     def name(self) -> str:
         return "total_interjections"
@@ -28,5 +18,5 @@ class InterjectionCountMetric(CountMetric):
     def description(self) -> str:
         return "Total number of all interjections (types 1-5 combined)"
     
-    def count(self, documents: list) -> int:
-        return len(get_all_interjections(documents))
+    def visit_interjection(self, document, view, where):
+        self.total += 1
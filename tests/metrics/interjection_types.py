@@ -2,22 +2,12 @@
 Metric: Type 1 (speaker) interjection count.
 """
 
-from .base import CountMetric
+from .base import CountMetric, VisitorMetric
 
 
-def get_all_interjections(documents):
-    """Get all interjections from documents and answers."""
-    return [
-        ij
-        for d in documents
-        for ij in d.get("interjections", [])
-        + d.get("answer", {}).get("interjections", [])
-    ]
-
-
-class Type1InterjectionCountMetric(CountMetric):
+class Type1InterjectionCountMetric(CountMetric, VisitorMetric):
     """Count type 1 (speaker) interjections."""
-    
+
     @property
     def name(self) -> str:
         return "t1_speaker"
@@ -30,13 +20,14 @@ class Type1InterjectionCountMetric(CountMetric):
     def description(self) -> str:
         return "Type 1 interjections - attributed to a specific speaker (MP by name)"
     
-    def count(self, documents: list) -> int:
-        return sum(1 for ij in get_all_interjections(documents) if ij.get("type") == 1)
+    def visit_interjection(self, document, view, where):
+        if view.item.get("type") == 1:
+            self.total += 1
 
 
-class Type2InterjectionCountMetric(CountMetric):
+class Type2InterjectionCountMetric(CountMetric, VisitorMetric):
     """Count type 2 (general) interjections."""
-    
+
     @property
     def name(self) -> str:
         return "t2_general"
@@ -49,13 +40,14 @@ class Type2InterjectionCountMetric(CountMetric):
     def description(self) -> str:
         return "Type 2 interjections - general/unattributed (e.g., 'Opposition members interjecting')"
     
-    def count(self, documents: list) -> int:
-        return sum(1 for ij in get_all_interjections(documents) if ij.get("type") == 2)
+    def visit_interjection(self, document, view, where):
+        if view.item.get("type") == 2:
+            self.total += 1
 
 
-class Type3InterjectionCountMetric(CountMetric):
+class Type3InterjectionCountMetric(CountMetric, VisitorMetric):
     """Count type 3 (office) interjections."""
-    
+
     @property
     def name(self) -> str:
         return "t3_office"
@@ -68,6 +60,7 @@ class Type3InterjectionCountMetric(CountMetric):
     def description(self) -> str:
         return "Type 3 interjections - from office holders (President, Clerk, Speaker)"
     
-    def count(self, documents: list) -> int:
-        return sum(1 for ij in get_all_interjections(documents) if ij.get("type") == 3)
+    def visit_interjection(self, document, view, where):
+        if view.item.get("type") == 3:
+            self.total += 1
 
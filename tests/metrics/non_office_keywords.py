@@ -2,22 +2,14 @@
 Metric: Non-office interjections with office keywords (PRESIDENT, CLERK, SPEAKER).
 """
 
-from .base import IssueMetric
+from .base import IssueMetric, VisitorMetric
 
+OFFICE_KEYWORDS = ["PRESIDENT", "CLERK", "SPEAKER"]
 
-def get_all_interjections(documents):
-    """Get all interjections from documents and answers."""
-    return [
-        ij
-        for d in documents
-        for ij in d.get("interjections", [])
-        + d.get("answer", {}).get("interjections", [])
-    ]
 
-
-class NonOfficeWithKeywordsMetric(IssueMetric):
+class NonOfficeWithKeywordsMetric(IssueMetric, VisitorMetric):
     """Find non-office interjections with office keywords."""
-    
+
     @property
     def name(self) -> str:
         return "non_office_keywords"
@@ -30,10 +22,8 @@ class NonOfficeWithKeywordsMetric(IssueMetric):
     def description(self) -> str:
         return "Non-type3 interjections containing PRESIDENT/CLERK/SPEAKER - should be type 3"
     
-    def find_issues(self, documents: list) -> list:
-        keywords = ["PRESIDENT", "CLERK", "SPEAKER"]
-        return [
-            ij for ij in get_all_interjections(documents)
-            if ij.get("type") != 3
-            and any(kw in ij.get("text", "") for kw in keywords)
-        ]
+    def visit_interjection(self, document, view, where):
+        if view.item.get("type") != 3 and any(
+            kw in view.text for kw in OFFICE_KEYWORDS
+        ):
+            self.issues.append(view.item)
@@ -2,10 +2,10 @@
 Metric: Question count.
 """
 
-from .base import CountMetric
+from .base import CountMetric, VisitorMetric
 
 
-class QuestionCountMetric(CountMetric):
+class QuestionCountMetric(CountMetric, VisitorMetric):
     @property
     def name(self) -> str:
         return "questions"
@@ -18,5 +18,6 @@ class QuestionCountMetric(CountMetric):
     def description(self) -> str:
         return "Number of question entries (with or without answers)"
     
-    def count(self, documents: list) -> int:
-        return sum(1 for d in documents if d.get("type") == "question")
+    def visit_document(self, document, view):
+        if document.get("type") == "question":
+            self.total += 1
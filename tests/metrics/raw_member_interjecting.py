@@ -2,12 +2,12 @@
 Metric: Raw "members interjecting" in speech text.
 """
 
-from .base import IssueMetric
+from .base import IssueMetric, VisitorMetric
 
 
-class RawMemberInterjectingMetric(IssueMetric):
+class RawMemberInterjectingMetric(IssueMetric, VisitorMetric):
     """Find speeches that contain raw 'members interjecting' text."""
-    
+
     @property
     def name(self) -> str:
         return "raw_member_interjecting"
@@ -20,9 +20,9 @@ class RawMemberInterjectingMetric(IssueMetric):
     def description(self) -> str:
         return "Speeches containing raw 'members interjecting' text - may indicate missed interjection extraction"
     
-    def find_issues(self, documents: list) -> list:
-        return [
-            d for d in documents
-            if "members interjecting"
-            in d.get("answer", {"text": ""})["text"] + d.get("text", "")
-        ]
+    def visit_document(self, document, view):
+        if (
+            "members interjecting"
+            in document.get("answer", {"text": ""})["text"] + view.text
+        ):
+            self.issues.append(document)
@@ -2,10 +2,10 @@
 Metric: Speech count.
 """
 
-from .base import CountMetric
+from .base import CountMetric, VisitorMetric
 
 
-class SpeechCountMetric(CountMetric):
+class SpeechCountMetric(CountMetric, VisitorMetric):
     @property
     def name(self) -> str:
         return "speeches"
@@ -18,5 +18,6 @@ class SpeechCountMetric(CountMetric):
     def description(self) -> str:
         return "Number of speech entries (non-question entries)"
     
-    def count(self, documents: list) -> int:
-        return sum(1 for d in documents if d.get("type") == "speech")
+    def visit_document(self, document, view):
+        if document.get("type") == "speech":
+            self.total += 1
@@ -2,17 +2,10 @@
 Metric: Title at start of interjection (title not stripped).
 """
 
-import re
+from .base import IssueMetric, VisitorMetric
 
-from .base import IssueMetric
 
-# Pattern for titles at START of text followed by ALL CAPS name and -
-TITLE_AT_START_PATTERN = re.compile(
-    r"^(Mr|Mrs|Ms|Dr|Senator|Sir|Madam|Hon)\s+[A-Z]{2,}.*?\s*-\s*"
-)
-
-
-class TitleAtInterjectionStartMetric(IssueMetric):
+class TitleAtInterjectionStartMetric(IssueMetric, VisitorMetric):
     """Find interjections where title appears at start (title not stripped)."""
 
     @property
@@ -27,35 +20,13 @@ class TitleAtInterjectionStartMetric(IssueMetric):
     def description(self) -> str:
         return "Title at start of interjection text - title was not stripped from the interjection"
 
-    def find_issues(self, documents: list) -> list:
-        issues = []
-
-        for d in documents:
-            # Check interjections
-            for ij in d.get("interjections", []):
-                ij_text = ij.get("text", "")
-                if ij_text and TITLE_AT_START_PATTERN.match(ij_text[:80]):
-                    issues.append(
-                        {
-                            "type": d.get("type"),
-                            "text": ij_text,
-                            "where": "interjection",
-                            "ij_type": ij.get("type"),
-                        }
-                    )
-
-            # Check answer interjections
-            if "answer" in d:
-                for ij in d.get("answer", {}).get("interjections", []):
-                    ij_text = ij.get("text", "")
-                    if ij_text and TITLE_AT_START_PATTERN.match(ij_text[:80]):
-                        issues.append(
-                            {
-                                "type": d.get("type"),
-                                "text": ij_text,
-                                "where": "answer_interjection",
-                                "ij_type": ij.get("type"),
-                            }
-                        )
-
-        return issues
+    def visit_interjection(self, document, view, where):
+        if view.title_at_start:
+            self.issues.append(
+                {
+                    "type": document.get("type"),
+                    "text": view.text,
+                    "where": where,
+                    "ij_type": view.item.get("type"),
+                }
+            )
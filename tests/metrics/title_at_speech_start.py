@@ -2,17 +2,10 @@
 Metric: Title at start of speech (potential missed interjection).
 """
 
-import re
+from .base import IssueMetric, VisitorMetric
 
-from .base import IssueMetric
 
-# Pattern for titles at START of text followed by ALL CAPS name and -
-TITLE_AT_START_PATTERN = re.compile(
-    r"^(Mr|Mrs|Ms|Dr|Senator|Sir|Madam|Hon)\s+[A-Z]{2,}.*?\s*-\s*"
-)
-
-
-class TitleAtSpeechStartMetric(IssueMetric):
+class TitleAtSpeechStartMetric(IssueMetric, VisitorMetric):
     """Find speeches where title appears in first few words (potential interjection not extracted)."""
 
     @property
@@ -27,25 +20,18 @@ class TitleAtSpeechStartMetric(IssueMetric):
     def description(self) -> str:
         return "Title (Mr, Senator, etc.) at start of speech text - may be a missed interjection"
 
-    def find_issues(self, documents: list) -> list:
-        issues = []
-
-        for d in documents:
-            text = d.get("text", "")
-            if text and TITLE_AT_START_PATTERN.match(text[:80]):
-                issues.append(
-                    {"type": d.get("type"), "text": text, "where": "speech"}
-                )
-
-            if "answer" in d:
-                ans_text = d.get("answer", {}).get("text", "")
-                if ans_text and TITLE_AT_START_PATTERN.match(ans_text[:80]):
-                    issues.append(
-                        {
-                            "type": d.get("type"),
-                            "text": ans_text[:60],
-                            "where": "answer",
-                        }
-                    )
-
-        return issues
+    def visit_document(self, document, view):
+        if view.title_at_start:
+            self.issues.append(
+                {"type": document.get("type"), "text": view.text, "where": "speech"}
+            )
+
+    def visit_answer(self, document, view):
+        if view.title_at_start:
+            self.issues.append(
+                {
+                    "type": document.get("type"),
+                    "text": view.text[:60],
+                    "where": "answer",
+                }
+            )
@@ -2,17 +2,10 @@
 Metric: Find titles (Mr, Senator, etc.) in speech content.
 """
 
-import re
+from .base import IssueMetric, VisitorMetric
 
-from .base import IssueMetric
 
-# Patterns for titles (e.g., "Senator SMITH", "Mr WATT") - only when name is ALL CAPS
-TITLE_PATTERN = re.compile(
-    r"\b(Mr|Mrs|Ms|Dr|Senator|Sir|Madam|Hon)\s+[A-Z]{2,}\b"
-)
-
-
-class TitlesInContentMetric(IssueMetric):
+class TitlesInContentMetric(IssueMetric, VisitorMetric):
     """Find speech/answer content containing title patterns."""
 
     @property
@@ -27,27 +20,19 @@ class TitlesInContentMetric(IssueMetric):
     def description(self) -> str:
         return "Speech/answer content containing title patterns (Mr, Senator, Sir, etc.) - may indicate missed interjections"
 
-    def find_issues(self, documents: list) -> list:
-        issues = []
-
-        for d in documents:
-            # Check speech text
-            text = d.get("text", "")
-            if TITLE_PATTERN.search(text):
-                issues.append(
-                    {"type": d.get("type"), "text": text, "where": "speech"}
-                )
-
-            # Check answers
-            if "answer" in d:
-                ans_text = d.get("answer", {}).get("text", "")
-                if TITLE_PATTERN.search(ans_text):
-                    issues.append(
-                        {
-                            "type": d.get("type"),
-                            "text": ans_text,
-                            "where": "answer",
-                        }
-                    )
-
-        return issues
+    def visit_document(self, document, view):
+        # Check speech text
+        if view.title_match:
+            self.issues.append(
+                {"type": document.get("type"), "text": view.text, "where": "speech"}
+            )
+
+    def visit_answer(self, document, view):
+        if view.title_match:
+            self.issues.append(
+                {
+                    "type": document.get("type"),
+                    "text": view.text,
+                    "where": "answer",
+                }
+            )
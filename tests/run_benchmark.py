@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Hansard Parser Benchmark - Measures parser throughput over the test files.
+
+Each test file is parsed with the parser module run_report.py picks for it,
+so every module in PARSER_BY_MODULE that has a fixture is exercised. Results
+are reported per era (massdigitisation, earlydigital, modern):
+
+- MB/s and documents/s over the era's files
+- p50 and p99 per-file latency
+- a breakdown of where the time goes: clean, tree build, chamber split,
+  speech extraction and text cleaning
+
+Throughput and latency come from uninstrumented runs. The breakdown comes
+from a separate run with the phase methods wrapped in timers, which adds
+overhead of its own, so read it as proportions.
+
+Run with: python3 tests/run_benchmark.py [--repeat N] [--save FILE]
+          [--compare FILE]
+"""
+
+import argparse
+import datetime
+import json
+import math
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.chamber_speech_extractor import ChamberSpeechExtractor
+from parsers.eras import (
+    SpeechExtractorEarlyDigital,
+    SpeechExtractorMassDigitisation,
+    SpeechExtractorModern,
+)
+from parsers.hansard_extractor import HansardExtractor
+from parsers.speech_extractor import SpeechExtractor
+from tests.run_report import (
+    PARSER_BY_MODULE,
+    get_all_test_files,
+    get_parser_for_file,
+)
+
+ERAS = {
+    "massdigitisation": SpeechExtractorMassDigitisation,
+    "earlydigital": SpeechExtractorEarlyDigital,
+    "modern": SpeechExtractorModern,
+}
+PHASES = [
+    "clean",
+    "tree build",
+    "chamber split",
+    "speech extraction",
+    "text cleaning",
+]
+
+
+def get_era(parser):
+    """Return the era of a parser module, from its speech extractor class."""
+    for value in vars(parser).values():
+        if not isinstance(value, type) or value.__module__ != parser.__name__:
+            continue
+        for era, base in ERAS.items():
+            if issubclass(value, base):
+                return era
+    return None
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+class PhaseTimer:
+    """
+    Exclusive wall time per phase. Each phase is the set of parser methods
+    that implement it; time spent in a nested timed call is counted against
+    the nested call's phase only.
+    """
+
+    def __init__(self):
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self._children = []
+        self._patched = []
+
+    def _targets(self):
+        yield HansardExtractor, "_clean_hansard_text", "clean"
+        yield HansardExtractor, "_repair_hansard", "tree build"
+        yield HansardExtractor, "_get_distinct_chambers", "chamber split"
+        yield ChamberSpeechExtractor, "extract", "speech extraction"
+        classes = [SpeechExtractor]
+        while classes:
+            cls = classes.pop()
+            classes.extend(cls.__subclasses__())
+            if "_clean_text" in cls.__dict__:
+                yield cls, "_clean_text", "text cleaning"
+
+    def _timed(self, phase, func):
+        def timed(*args, **kwargs):
+            self._children.append(0.0)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.totals[phase] += elapsed - self._children.pop()
+                if self._children:
+                    self._children[-1] += elapsed
+
+        return timed
+
+    def __enter__(self):
+        for cls, name, phase in self._targets():
+            original = cls.__dict__[name]
+            if isinstance(original, staticmethod):
+                wrapped = staticmethod(self._timed(phase, original.__func__))
+            else:
+                wrapped = self._timed(phase, original)
+            self._patched.append((cls, name, original))
+            setattr(cls, name, wrapped)
+        return self
+
+    def __exit__(self, *exc):
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched = []
+
+
+def load_cases():
+    """Return the test files with their text, size, parser and era."""
+    cases = []
+    for test_file in get_all_test_files():
+        parser = get_parser_for_file(test_file)
+        if parser is None:
+            continue
+        text = test_file.read_text()
+        cases.append(
+            {
+                "year": test_file.stem,
+                "text": text,
+                "bytes": len(text.encode("utf-8")),
+                "parser": parser,
+                "era": get_era(parser),
+            }
+        )
+    return cases
+
+
+def time_case(case, repeat):
+    """Return (best seconds, documents) of parsing a test file repeat times."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chambers = case["parser"].parse(case["text"])
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    documents = sum(len(chamber["documents"]) for chamber in chambers)
+    return best, documents
+
+
+def time_phases(cases):
+    """Return (total seconds, {phase: seconds}) of one instrumented run."""
+    with PhaseTimer() as timer:
+        start = time.perf_counter()
+        for case in cases:
+            case["parser"].parse(case["text"])
+        total = time.perf_counter() - start
+    return total, timer.totals
+
+
+def summarise(cases, timings):
+    seconds = sum(timings[case["year"]][0] for case in cases)
+    size = sum(case["bytes"] for case in cases)
+    documents = sum(timings[case["year"]][1] for case in cases)
+    latencies = [timings[case["year"]][0] for case in cases]
+    return {
+        "files": len(cases),
+        "bytes": size,
+        "documents": documents,
+        "seconds": seconds,
+        "mb_per_s": size / 1e6 / seconds,
+        "docs_per_s": documents / seconds,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def run_benchmark(repeat):
+    """Benchmark every test file, returning the results as a dict."""
+    cases = load_cases()
+    timings = {}
+    errors = {}
+    for case in cases:
+        try:
+            timings[case["year"]] = time_case(case, repeat)
+        except Exception as e:
+            errors[case["year"]] = f"{type(e).__name__}: {e}"
+    cases = [case for case in cases if case["year"] in timings]
+
+    results = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": get_commit(),
+        "repeat": repeat,
+        "modules": sorted({case["parser"].__name__ for case in cases}),
+        "errors": errors,
+        "eras": {},
+    }
+    all_total = 0.0
+    all_phases = dict.fromkeys(PHASES, 0.0)
+    for era in ERAS:
+        era_cases = [case for case in cases if case["era"] == era]
+        if not era_cases:
+            continue
+        summary = summarise(era_cases, timings)
+        total, phases = time_phases(era_cases)
+        summary["phases"] = phase_shares(total, phases)
+        results["eras"][era] = summary
+        all_total += total
+        for phase, seconds in phases.items():
+            all_phases[phase] += seconds
+    if cases:
+        summary = summarise(cases, timings)
+        summary["phases"] = phase_shares(all_total, all_phases)
+        results["eras"]["all"] = summary
+    return results
+
+
+def phase_shares(total, phases):
+    """Each phase's share of total, with the untimed rest as "other"."""
+    shares = {phase: seconds / total for phase, seconds in phases.items()}
+    shares["other"] = max(0.0, 1 - sum(shares.values()))
+    return shares
+
+
+def get_commit():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def print_results(results):
+    print("=" * 80)
+    print("HANSARD PARSER BENCHMARK")
+    print("=" * 80)
+    print(f"Commit: {results['commit']}  Repeat: {results['repeat']}")
+    print(f"Modules: {', '.join(results['modules'])}")
+    untested = sorted(set(PARSER_BY_MODULE) - set(results["modules"]))
+    if untested:
+        print(f"No test file routed to: {', '.join(untested)}")
+    print()
+
+    print(
+        f"{'Era':<18} {'Files':>5} {'MB':>7} {'Docs':>7} {'MB/s':>7}"
+        f" {'Docs/s':>8} {'p50 ms':>8} {'p99 ms':>8}"
+    )
+    print("-" * 80)
+    for era, summary in results["eras"].items():
+        print(
+            f"{era:<18} {summary['files']:>5} {summary['bytes'] / 1e6:>7.1f}"
+            f" {summary['documents']:>7} {summary['mb_per_s']:>7.2f}"
+            f" {summary['docs_per_s']:>8.0f} {summary['p50_ms']:>8.1f}"
+            f" {summary['p99_ms']:>8.1f}"
+        )
+
+    print("\nTime breakdown (share of instrumented run)")
+    eras = list(results["eras"])
+    print(f"{'Phase':<18}" + "".join(f" {era:>16}" for era in eras))
+    print("-" * 80)
+    for phase in PHASES + ["other"]:
+        shares = "".join(
+            f" {results['eras'][era]['phases'][phase] * 100:>15.1f}%"
+            for era in eras
+        )
+        print(f"{phase:<18}{shares}")
+
+    if results["errors"]:
+        print("\nErrors (not timed)")
+        for year, error in results["errors"].items():
+            print(f"  {year}: {error}")
+
+
+def print_comparison(baseline, results):
+    """Print the change of each era's throughput and latency from baseline."""
+    print("\n" + "=" * 80)
+    print(f"COMPARED TO {baseline.get('commit')} ({baseline.get('created')})")
+    print("=" * 80)
+    metrics = ["mb_per_s", "docs_per_s", "p50_ms", "p99_ms"]
+    print(f"{'Era':<18}" + "".join(f" {m:>14}" for m in metrics))
+    print("-" * 80)
+    for era, summary in results["eras"].items():
+        before = baseline.get("eras", {}).get(era)
+        if before is None:
+            print(f"{era:<18} (not in baseline)")
+            continue
+        changes = ""
+        for metric in metrics:
+            change = (summary[metric] / before[metric] - 1) * 100
+            changes += f" {change:>+13.1f}%"
+        print(f"{era:<18}{changes}")
+    print("\nPositive is faster for MB/s and docs/s, slower for latencies.")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure parser throughput over the test files."
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Parse each file this many times and keep the best time.",
+    )
+    parser.add_argument(
+        "--save", type=Path, help="Write the results to this JSON file."
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Compare the results with a JSON file written by --save.",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmark(args.repeat)
+    print_results(results)
+
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(json.load(f), results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved results to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
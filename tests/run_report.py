@@ -5,16 +5,23 @@ Hansard Parser Report - Generates a diagnostic report for each parser/test file.
 Run with: python3 tests/run_report.py
 """
 
+import argparse
+import os
+import pickle
 import sys
 import traceback
 import json
 import datetime
 import importlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
 # Directory to save parsed outputs
 PARSED_OUTPUT_DIR = Path("/tmp/hansard_parsed")
+# Directory of cached parses, see parse_cache_path
+PARSE_CACHE_DIR = Path("/tmp/hansard_parse_cache")
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -30,10 +37,16 @@ from parsers import (
     hansard2012,
     hansard2021,
 )
+from parsers.fingerprint import content_hash, parser_fingerprint
+from parsers.hansard_extractor import group_documents
+from scripts.sources import SOURCES as SOURCE_REGISTRY
 from tests.metrics import get_all_metrics
 from tests.metrics.base import MetricResult, CountMetric, IssueMetric
+from tests.metrics.engine import ChamberMetricEngine
 
 TESTS_DIR = Path(__file__).parent / "xml"
+# Bytes of a test file read at a time while looking for its date
+DATE_READ_SIZE = 2**14
 
 # Parser mapping from seed sources
 PARSER_BY_MODULE = {
@@ -59,44 +72,46 @@ def get_all_test_files():
 
 
 def get_date_from_xml(file_path):
-    """Extract date from XML file."""
+    """
+    Extract the date from the first <date> of an XML file, parsing only as
+    far as that element.
+    """
+    parser = ET.XMLPullParser(events=("end",))
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        date_elem = root.find(".//date")
-        if date_elem is not None and date_elem.text:
-            return datetime.datetime.strptime(date_elem.text, "%Y-%m-%d").date()
+        with open(file_path, "rb") as f:
+            while chunk := f.read(DATE_READ_SIZE):
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    if elem.tag == "date":
+                        return _parse_date(elem.text)
+            parser.close()
     except Exception:
         pass
     return None
 
 
-def load_sources_from_seed():
-    """Load source date ranges from seed.py."""
-    # Read the seed.py file and extract sources
-    seed_path = Path(__file__).parent.parent / "scripts" / "seed.py"
-    with open(seed_path) as f:
-        content = f.read()
-
-    # Parse sources from the file
-    sources = []
-    # Simple regex to extract id, parserModule, from_day, to_day
-    import re
+def _parse_date(text):
+    try:
+        return datetime.datetime.strptime(text, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
 
-    pattern = r'"id":\s*(\d+).*?"parserModule":\s*"([^"]+)".*?"from_day":\s*"([^"]+)".*?"to_day":\s*"([^"]+)"'
-    matches = re.findall(pattern, content, re.DOTALL)
 
-    for match in matches:
-        source_id, parser_module, from_day, to_day = match
-        from_date = datetime.datetime.strptime(from_day, "%Y-%m-%d").date()
-        to_date = datetime.datetime.strptime(to_day, "%Y-%m-%d").date()
-        parser = PARSER_BY_MODULE.get(parser_module)
+def load_sources():
+    """Load the source date ranges of the parsers from scripts.sources."""
+    sources = []
+    for source in SOURCE_REGISTRY:
+        parser = PARSER_BY_MODULE.get(source["parserModule"])
         if parser:
             sources.append(
                 {
-                    "id": int(source_id),
-                    "from_date": from_date,
-                    "to_date": to_date,
+                    "id": source["id"],
+                    "from_date": datetime.date.fromisoformat(
+                        source["args_dict"]["from_day"]
+                    ),
+                    "to_date": datetime.date.fromisoformat(
+                        source["args_dict"]["to_day"]
+                    ),
                     "parser": parser,
                 }
             )
@@ -105,7 +120,7 @@ def load_sources_from_seed():
 
 
 # Load sources once
-SOURCES = load_sources_from_seed()
+SOURCES = load_sources()
 
 
 def get_parser_for_file(test_file):
@@ -135,72 +150,160 @@ def get_parser_for_file(test_file):
     return None
 
 
-def generate_report():
-    """Generate a diagnostic report for all parsers and test files."""
-    print("=" * 80)
-    print("HANSARD PARSER DIAGNOSTIC REPORT")
-    print("=" * 80)
+def write_parsed_output(chambers, output_file):
+    """Write chamber dicts as json.dump(list(chambers), indent=2) would."""
+    with open(output_file, "w") as f:
+        separator = "[\n  "
+        for chamber in chambers:
+            f.write(separator)
+            # Newlines only appear between tokens, strings escape theirs
+            chamber_json = json.dumps(chamber, indent=2, ensure_ascii=False)
+            f.write(chamber_json.replace("\n", "\n  "))
+            separator = ",\n  "
+        f.write("[]" if separator == "[\n  " else "\n]")
 
-    # Get all metric classes
-    metric_classes = get_all_metrics()
-    print(f"\nLoaded {len(metric_classes)} metrics")
 
-    test_files = get_all_test_files()
-    print(f"Found {len(test_files)} test files\n")
+def parse_cache_path(parser, text):
+    """
+    Return the cache file of parser's parse of text.
 
-    results = []
+    The key is the hash of the text and the parser's fingerprint, a hash of
+    every parsers/ source file the parser module imports (its era base
+    classes included), so editing any of them invalidates its entries.
+    """
+    key = f"{content_hash(text)}-{parser_fingerprint(parser.__name__)}"
+    return PARSE_CACHE_DIR / f"{key}.pickle"
 
-    for test_file in test_files:
-        year = test_file.stem
-        parser = get_parser_for_file(test_file)
 
-        report = {
-            "year": year,
-            "parser": parser.__name__ if parser else None,
-            "error": None,
-            "metrics": {},
-        }
+def load_parse(cache_path):
+    """Return the cached list of chamber dicts, or None on a miss."""
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
 
-        if parser is None:
-            report["error"] = "No parser found"
-            results.append(report)
-            continue
 
-        try:
-            text = test_file.read_text()
-            parsed_result = parser.parse(text)
+def save_parse(cache_path, chambers):
+    # Written to a temporary file and renamed, so concurrent --jobs workers
+    # never read a partial entry
+    PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(chambers, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
 
-            if not isinstance(parsed_result, list):
-                report["error"] = (
-                    f"parse() returned {type(parsed_result).__name__}, expected list"
-                )
-                results.append(report)
-                continue
 
-            if len(parsed_result) == 0:
-                results.append(report)
-                continue
+def collect(chambers, into):
+    """Yield chambers, appending each to into."""
+    for chamber in chambers:
+        into.append(chamber)
+        yield chamber
 
-            # Save parsed result to file
-            PARSED_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-            output_file = PARSED_OUTPUT_DIR / f"{year}.json"
-            with open(output_file, "w") as f:
-                json.dump(parsed_result, f, indent=2, ensure_ascii=False)
 
-            # Run each metric
-            for metric_cls in metric_classes:
-                metric = metric_cls()
-                try:
-                    result = metric.run(parsed_result)
-                    report["metrics"][result.name] = result
-                except Exception as e:
-                    report["metrics"][metric.name] = {"error": str(e)}
+def report_file(test_file, metric_classes, use_cache=True):
+    """
+    Parse one test file, save its parsed output and run the metrics.
+
+    With use_cache the parse is loaded from PARSE_CACHE_DIR when the file
+    and parser are unchanged since it was stored, and stored otherwise.
+    """
+    year = test_file.stem
+    parser = get_parser_for_file(test_file)
+
+    report = {
+        "year": year,
+        "parser": parser.__name__ if parser else None,
+        "error": None,
+        "metrics": {},
+        "chambers": [],
+    }
+
+    if parser is None:
+        report["error"] = "No parser found"
+        return report
+
+    try:
+        text = test_file.read_text()
+        cache_path = parse_cache_path(parser, text) if use_cache else None
+        parsed = load_parse(cache_path) if cache_path else None
+        fresh = parsed is None
+        if fresh:
+            parsed = []
+            chambers = collect(group_documents(parser.iter_parse(text)), parsed)
+        else:
+            chambers = iter(parsed)
+        first_chamber = next(chambers, None)
+
+        if first_chamber is None:
+            if fresh and cache_path:
+                save_parse(cache_path, parsed)
+            return report
+
+        # Score every chamber, in one walk over its documents, as it is
+        # saved to file
+        engine = ChamberMetricEngine(metric_classes)
+
+        def scored(chambers):
+            for chamber in chambers:
+                engine.add(chamber)
+                yield chamber
+
+        PARSED_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        output_file = PARSED_OUTPUT_DIR / f"{year}.json"
+        write_parsed_output(
+            scored(itertools.chain([first_chamber], chambers)), output_file
+        )
+
+        report["metrics"].update(engine.results())
+        report["chambers"] = engine.chambers
+        if fresh and cache_path:
+            save_parse(cache_path, parsed)
+
+    except Exception:
+        report["error"] = traceback.format_exc()
+
+    return report
+
+
+def generate_report(jobs=1, use_cache=True):
+    """
+    Generate a diagnostic report for all parsers and test files.
+
+    With jobs > 1 the files are parsed and scored in a pool of that many
+    processes, largest first, and the reports are returned in file order.
+    With use_cache, parses are loaded from and stored in PARSE_CACHE_DIR.
+    """
+    print("=" * 80)
+    print("HANSARD PARSER DIAGNOSTIC REPORT")
+    print("=" * 80)
+
+    # Get all metric classes
+    metric_classes = get_all_metrics()
+    print(f"\nLoaded {len(metric_classes)} metrics")
 
-        except Exception:
-            report["error"] = traceback.format_exc()
+    test_files = get_all_test_files()
+    print(f"Found {len(test_files)} test files\n")
 
-        results.append(report)
+    if jobs <= 1:
+        return [report_file(f, metric_classes, use_cache) for f in test_files]
 
+    # Start the slowest files first so none is left running alone at the end
+    order = sorted(
+        range(len(test_files)),
+        key=lambda i: test_files[i].stat().st_size,
+        reverse=True,
+    )
+    results = [None] * len(test_files)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(
+                report_file, test_files[i], metric_classes, use_cache
+            ): i
+            for i in order
+        }
+        for future, i in futures.items():
+            results[i] = future.result()
     return results
 
 
@@ -274,6 +377,8 @@ def print_report(results):
         )
         print(f"  {name}: {total}")
 
+    print_chamber_counts(valid_results)
+
     # --- ISSUES SECTION ---
     print("\n" + "=" * 80)
     print("ISSUES (non-zero counts)")
@@ -355,6 +460,72 @@ def print_report(results):
             print(f"{r['year']}: {r['error']}")
 
 
+def print_chamber_counts(valid_results):
+    """Print the counts of each chamber, then totals by chamber."""
+    print("\n" + "=" * 80)
+    print("CHAMBER COUNTS")
+    print("=" * 80)
+
+    rows = [
+        (r["year"], chamber, metrics)
+        for r in valid_results
+        for chamber, metrics in r.get("chambers", [])
+    ]
+    totals = {}
+    for _, chamber, metrics in rows:
+        chamber_totals = totals.setdefault(
+            chamber, dict.fromkeys(COUNT_METRICS, 0)
+        )
+        for name in COUNT_METRICS:
+            metric_result = metrics.get(name)
+            if hasattr(metric_result, "count"):
+                chamber_totals[name] += metric_result.count
+
+    col_widths = {"Year": 8, "Chamber": 20}
+    for name in COUNT_METRICS:
+        col_widths[name] = max(
+            [len(name), 6] + [len(str(t[name])) for t in totals.values()]
+        )
+    for _, chamber, _ in rows:
+        col_widths["Chamber"] = max(col_widths["Chamber"], len(str(chamber)))
+
+    header_parts = [
+        f"{'Year':<{col_widths['Year']}}",
+        f"{'Chamber':<{col_widths['Chamber']}}",
+    ]
+    for name in COUNT_METRICS:
+        header_parts.append(f"{name:>{col_widths[name]}}")
+    header = "  ".join(header_parts)
+    print(header)
+    print("-" * len(header))
+
+    for year, chamber, metrics in rows:
+        row_parts = [
+            f"{year:<{col_widths['Year']}}",
+            f"{str(chamber):<{col_widths['Chamber']}}",
+        ]
+        for name in COUNT_METRICS:
+            metric_result = metrics.get(name)
+            width = col_widths[name]
+            if metric_result is None or not hasattr(metric_result, "count"):
+                row_parts.append(f"{'-':>{width}}")
+            else:
+                row_parts.append(f"{metric_result.count:>{width}}")
+        print("  ".join(row_parts))
+
+    print("-" * len(header))
+
+    # Totals by chamber
+    for chamber, chamber_totals in totals.items():
+        row_parts = [
+            f"{'TOTAL':<{col_widths['Year']}}",
+            f"{str(chamber):<{col_widths['Chamber']}}",
+        ]
+        for name in COUNT_METRICS:
+            row_parts.append(f"{chamber_totals[name]:>{col_widths[name]}}")
+        print("  ".join(row_parts))
+
+
 def print_issue_details(results):
     """Print detailed examples of each issue."""
 
@@ -389,6 +560,23 @@ def print_issue_details(results):
 
 
 if __name__ == "__main__":
-    results = generate_report()
+    arg_parser = argparse.ArgumentParser(
+        description="Generate a diagnostic report for each test file."
+    )
+    arg_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes to parse and score the test files with.",
+    )
+    arg_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse every test file, without reading or writing the parse "
+        "cache.",
+    )
+    args = arg_parser.parse_args()
+
+    results = generate_report(args.jobs, not args.no_cache)
     print_report(results)
     print_issue_details(results)
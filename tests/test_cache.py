@@ -0,0 +1,92 @@
+"""
+Tests for scrapers.cache.FetchCache.
+
+Requires pytest (requirements-dev.txt). Run with:
+python3 tests/test_cache.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.cache import FetchCache
+
+URL = "https://parlinfo.aph.gov.au/hansard.xml"
+
+
+def body():
+    """Text that does not compress away, so every blob has a real size."""
+    return os.urandom(4096).hex()
+
+
+def blob_files(cache):
+    blobs = Path(cache.root, "blobs").rglob("*")
+    return sorted(path.name for path in blobs if path.is_file())
+
+
+def test_store_new_version_frees_old_blob(tmp_path):
+    cache = FetchCache(str(tmp_path))
+    first, second = body(), body()
+
+    cache.store(URL, first, etag='"1"')
+    size_first = cache.size()
+    cache.store(URL, second, etag='"2"')
+
+    assert cache.read(URL) == second
+    assert cache.lookup(URL).etag == '"2"'
+    digest = cache.lookup(URL).digest
+    assert blob_files(cache) == [digest]
+    assert cache.size() == os.path.getsize(cache._blob_path(digest))
+    assert cache.size() < 2 * size_first
+
+
+def test_store_new_version_keeps_shared_blob(tmp_path):
+    cache = FetchCache(str(tmp_path))
+    shared = body()
+
+    cache.store(URL, shared)
+    cache.store("https://example.org/copy.xml", shared)
+    cache.store(URL, body())
+
+    assert cache.read("https://example.org/copy.xml") == shared
+    assert len(blob_files(cache)) == 2
+
+
+def test_eviction_holds_size_bound_when_refetching(tmp_path):
+    cache = FetchCache(str(tmp_path))
+    cache.store(URL, body())
+    blob_size = cache.size()
+    cache.max_bytes = 3 * blob_size
+
+    for _ in range(10):
+        cache.store(URL, body())
+        cache.store("https://example.org/other.xml", body())
+        assert cache.size() <= cache.max_bytes
+
+    assert cache.read(URL) is not None
+    assert len(blob_files(cache)) == 2
+
+
+def test_evict_drops_unreferenced_blobs_before_entries(tmp_path):
+    cache = FetchCache(str(tmp_path))
+    cache.store(URL, body())
+    blob_size = cache.size()
+    # An orphan left by a cache written before stores freed old versions
+    cache.db.execute("DELETE FROM entries")
+    cache.db.commit()
+    cache.max_bytes = blob_size * 3 // 2
+
+    cache.store("https://example.org/other.xml", body())
+
+    assert cache.read("https://example.org/other.xml") is not None
+    assert cache.size() <= cache.max_bytes
+    assert len(blob_files(cache)) == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,125 @@
+"""
+Tests for scrapers.fetch: Retry-After parsing, backoff bounds and retries
+against a local aiohttp server.
+
+Requires pytest (requirements-dev.txt). Run with:
+python3 tests/test_fetch.py
+"""
+
+import asyncio
+import datetime
+import email.utils
+import sys
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add parent to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scrapers.fetch import Fetcher, backoff_delay, parse_retry_after
+
+
+def http_date(seconds_from_now):
+    when = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+        seconds=seconds_from_now
+    )
+    return email.utils.format_datetime(when, usegmt=True)
+
+
+def test_parse_retry_after_seconds():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("0") == 0.0
+    assert parse_retry_after("-3") == 0.0
+
+
+def test_parse_retry_after_http_date():
+    assert 25 <= parse_retry_after(http_date(30)) <= 30
+    assert parse_retry_after(http_date(-30)) == 0.0
+
+
+def test_parse_retry_after_missing_or_invalid():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("soon") is None
+
+
+def test_backoff_delay_bounds():
+    for attempt in range(10):
+        cap = min(120.0, 2.0 * 2**attempt)
+        for _ in range(100):
+            assert 0 <= backoff_delay(attempt, 2.0, 120.0) <= cap
+
+
+def test_backoff_delay_retry_after_wins_up_to_max_delay():
+    assert backoff_delay(0, 2.0, 120.0, retry_after=30.0) == 30.0
+    assert backoff_delay(5, 2.0, 120.0, retry_after=0.0) == 0.0
+    assert backoff_delay(0, 2.0, 120.0, retry_after=600.0) == 120.0
+
+
+async def serve_and_fetch(responses, path="/hansard.xml", **fetcher_args):
+    """
+    Fetch path from a server that answers with responses in turn, returning
+    (result or exception, number of requests served).
+    """
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        return responses[min(len(requests), len(responses)) - 1]()
+
+    app = web.Application()
+    app.router.add_get(path, handler)
+    async with TestServer(app) as server:
+        fetcher_args = {"rate": 100, "base_delay": 0.01, **fetcher_args}
+        async with Fetcher(**fetcher_args) as fetcher:
+            try:
+                result = await fetcher.fetch(str(server.make_url(path)))
+            except Exception as e:
+                result = e
+    return result, len(requests)
+
+
+def test_fetch_retries_429_then_succeeds():
+    result, served = asyncio.run(
+        serve_and_fetch(
+            [
+                lambda: web.Response(status=429, headers={"Retry-After": "0"}),
+                lambda: web.Response(text="<hansard/>"),
+            ]
+        )
+    )
+    assert result == "<hansard/>"
+    assert served == 2
+
+
+def test_fetch_returns_none_on_404():
+    result, served = asyncio.run(
+        serve_and_fetch([lambda: web.Response(status=404)])
+    )
+    assert result is None
+    assert served == 1
+
+
+def test_fetch_gives_up_after_retries():
+    result, served = asyncio.run(
+        serve_and_fetch([lambda: web.Response(status=503)], retries=3)
+    )
+    assert isinstance(result, Exception)
+    assert "after 3 attempts" in str(result)
+    assert served == 3
+
+
+def test_fetch_does_not_retry_other_errors():
+    result, served = asyncio.run(
+        serve_and_fetch([lambda: web.Response(status=400)])
+    )
+    assert isinstance(result, Exception)
+    assert "returned 400" in str(result)
+    assert served == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))